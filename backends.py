@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : backends.py
+Date    : Friday 16 October 2026
+Desc.   : The branchy parts of reproduction that do not vectorise well, finding the best mate, picking a colour from
+          the roulette of Point.pick_one and working out which children survive overcrowding, done by a pluggable
+          backend. The kernels are written once as plain loops. The numba backend compiles them when Numba is
+          installed, the python backend uses the bucketed MateIndex and NumPy instead. Both give the same answers, so
+          a seeded world comes out the same whichever one it runs on.
+History : 16/10/2026 - v1.0 - Created project file, added PythonBackend, NumbaBackend and get
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+from spatial_index import MateIndex, SortedMateIndex
+
+try:
+    import numba
+except ImportError:  # Numba is optional, everything runs on the python backend without it
+    numba = None
+
+
+def roulette(probabilities, r):
+    """Point.pick_one once r has been drawn, takes each chance away from r until it reaches 0 or below
+
+    :param probabilities: Chance of each choice
+    :param double r: Draw between 0 - 1
+
+    :rtype: int
+    :return: Index of the choice, -1 when r is 0
+    """
+    index = 0
+    while r > 0:
+        r = r - probabilities[index]
+        index += 1
+        if index >= len(probabilities):
+            break
+    return index - 1
+
+
+def _pick(probabilities, r):
+    # roulette for every row, written out again as a compiled kernel can only call other compiled kernels
+    picked = np.empty(len(r), dtype=np.int64)
+    for i in range(len(r)):
+        left = r[i]
+        index = 0
+        while left > 0:
+            left = left - probabilities[i, index]
+            index += 1
+            if index >= probabilities.shape[1]:
+                break
+        picked[i] = index - 1
+    return picked
+
+
+def _best_mate(cells, rank, alive, nutrients, x1, y1, radius):
+    # MateIndex.best_mate over mature daisies sorted by flat index, each row of the search square is one slice
+    x_dim, y_dim = nutrients.shape
+    reach = int(math.floor(radius))
+    best_mate = -1
+    best_fitness = 0.0
+    best_rank = -1
+    for x2 in range(max(0, x1 - reach), min(x_dim, x1 + reach + 1)):
+        row = x2 * y_dim
+        start = np.searchsorted(cells, row + max(0, y1 - reach))
+        stop = np.searchsorted(cells, row + min(y_dim - 1, y1 + reach), side="right")
+        for i in range(start, stop):
+            if not alive[i]:
+                continue
+            y2 = cells[i] - row
+            # Works out Euclidean distance between daisies
+            locality = math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+            if locality == 0 or locality > radius:
+                continue
+            fitness = nutrients[x2, y2] / locality
+            if fitness > best_fitness or (fitness == best_fitness and best_rank >= 0 and rank[i] < best_rank):
+                best_mate = cells[i]
+                best_fitness = fitness
+                best_rank = rank[i]
+    return best_mate
+
+
+def _settle(cells, settled):
+    # Claims sorted by point, in the order their parents took turns. Children land until one that is not the
+    # colour of bare ground does, the last one to land stays
+    landed = np.zeros(len(cells), dtype=np.bool_)
+    last = np.zeros(len(cells), dtype=np.bool_)
+    i = 0
+    while i < len(cells):
+        taken = False
+        kept = -1
+        j = i
+        while j < len(cells) and cells[j] == cells[i]:
+            if not taken:
+                landed[j] = True
+                kept = j
+                taken = settled[j]
+            j += 1
+        if kept >= 0:
+            last[kept] = True
+        i = j
+    return landed, last
+
+
+class PythonBackend:
+    name = "python"
+
+    def mate_index(self, coords, radius, shape):
+        """Index of mature daisies to find mates in, see spatial_index.MateIndex
+
+        :param list coords: Coordinates of the mature daisies, in the order they get to pick a mate
+        :param int radius: Furthest distance a daisy will go to find a mate
+        :param tuple shape: Dimensions of the grid
+
+        :return: Index with the methods of MateIndex
+        """
+        return MateIndex(coords, radius)
+
+    def pick(self, probabilities, r):
+        """Point.pick_one for every row of probabilities
+
+        :param numpy.ndarray probabilities: Chance of each choice, one row per pick
+        :param numpy.ndarray r: Draw between 0 - 1 for each row
+
+        :rtype: numpy.ndarray
+        :return: Index of the choice for each row, -1 where r is 0
+        """
+        choices = probabilities.shape[1]
+        # Stops at the first choice that takes what is left of r to 0 or below, or at the last choice
+        index = np.full(len(r), choices - 1)
+        left = r
+        decided = np.zeros(len(r), dtype=bool)
+        for i in range(choices - 1):
+            left = left - probabilities[:, i]
+            picked = ~decided & (left <= 0)
+            index[picked] = i
+            decided |= picked
+        return np.where(r > 0, index, -1)
+
+    def settle(self, cells, settled):
+        """Works out which children landing on the same points survive, like placing them one at a time
+
+        :param numpy.ndarray cells: Point each child lands on, sorted with children on the same point in turn order
+        :param numpy.ndarray settled: True for each child not the colour of bare ground, the first of these to land on
+                                      a point keeps it
+
+        :rtype: tuple
+        :return: True for each child that landed and True for each child left on its point
+        """
+        first = np.ones(len(cells), dtype=bool)
+        first[1:] = cells[1:] != cells[:-1]
+        settled_before = np.cumsum(settled) - settled
+        landed = (settled_before - np.maximum.accumulate(np.where(first, settled_before, 0))) == 0
+        # The last child to land on a point is the one left there
+        last = landed.copy()
+        last[:-1] &= ~landed[1:] | first[1:]
+        return landed, last
+
+
+class NumbaBackend(PythonBackend):
+    name = "numba"
+
+    def __init__(self):
+        jit = numba.njit(cache=True)
+        self._pick = jit(_pick)
+        self._best_mate = jit(_best_mate)
+        self._settle = jit(_settle)
+
+    def mate_index(self, coords, radius, shape):
+        return SortedMateIndex(coords, radius, shape, self._best_mate)
+
+    def pick(self, probabilities, r):
+        return self._pick(np.ascontiguousarray(probabilities, dtype=np.float64), np.asarray(r, dtype=np.float64))
+
+    def settle(self, cells, settled):
+        return self._settle(np.asarray(cells, dtype=np.intp), np.asarray(settled, dtype=np.bool_))
+
+
+names = ("python", "numba")
+
+
+def get(name=None):
+    """Backend of a name, made once and shared by every world using it
+
+    :param str name: One of names, None for numba when it is installed and python otherwise
+
+    :rtype: PythonBackend
+    :return: Backend
+    """
+    if name is None:
+        name = "python" if numba is None else "numba"
+    if name not in names:
+        raise ValueError("Unknown backend " + repr(name) + ", expected one of " + ", ".join(names))
+    if name == "numba" and numba is None:
+        raise ImportError("The numba backend needs Numba installed, use the python backend instead")
+    return _make(name)
+
+
+@lru_cache(maxsize=None)
+def _make(name):
+    return NumbaBackend() if name == "numba" else PythonBackend()
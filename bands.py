@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : bands.py
+Date    : Friday 16 October 2026
+Desc.   : Runs one large enhanced Daisyworld across many processes. The grid is split into latitude bands, rows of
+          y-coordinates, and every band is looked after by its own worker. The state of every point is moved into
+          shared memory, so a worker reads the rows just past the edge of its band, its halo, straight from its
+          neighbours rather than having them copied over. Each cycle the workers work out temperature, then diffuse
+          it and grow their daisies, then reproduce, with the planetary albedo added up from every band at the start.
+          Children land up to 5 rows away and mates are up to Point.mate_range away, so every band is at least twice
+          that high and even bands reproduce before odd ones. Bands reproducing at the same time never touch the
+          same points, so a cycle is the same as the daisies of the even bands taking their turns, then those of the
+          odd bands. Children are placed like batched reproduction, so results differ from a world run in one
+          process, and depend on the number of bands.
+History : 16/10/2026 - v1.0 - Created project file, added BandedWorld
+          16/10/2026 - v1.1 - Workers run on the backend of the world
+          16/10/2026 - v1.2 - Results count every species of the world's table
+          16/10/2026 - v1.3 - Refuses a world stopped partway through a luminosity
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import math
+import multiprocessing
+import os
+
+import numpy as np
+
+import backends
+import kernels
+import neighbourhood
+import placement
+from events import EventSchedule
+from genome import NO_GENE
+from grid import NO_AGE
+from point import Point
+from results import CycleSummary, RunResult, StepResult
+from species import NO_SPECIES
+
+# Arrays of the grid moved into shared memory
+shared = ("colour", "local_temp", "age", "nutrients", "opt_temp", "genes", "species")
+# Settings of Point the workers need, copied over in case they were changed in this process
+settings = ("age_of_death", "maturity_age", "req_resource", "sexual_cost", "clonal_cost", "mate_range",
+            "mutation_rate_low", "mutation_rate_high", "flux")
+
+# Turn of each mature daisy, kept in shared memory so bands can see which daisies near their edge are free to mate
+WAITING = 1
+TURNED = 2
+
+
+def halo_rows():
+    """Furthest a band reaches past its edge, for a mate or for a child to land
+
+    :rtype: int
+    :return: Number of rows
+    """
+    dispersal = max(abs(dy) for dx, dy in neighbourhood.dispersal_deltas)
+    return max(1, dispersal, math.ceil(Point.mate_range))
+
+
+def band_edges(y_dim, bands, halo):
+    """Splits the rows of a grid into bands as even as possible, using fewer bands if they would be less than twice
+    the halo high
+
+    :param int y_dim: Height of the grid
+    :param int bands: Number of bands wanted
+    :param int halo: Output of halo_rows
+
+    :rtype: numpy.ndarray
+    :return: First row of every band followed by y_dim
+    """
+    bands = max(1, min(bands, y_dim // (2 * halo)))
+    return np.linspace(0, y_dim, bands + 1).astype(int)
+
+
+class _BandGrid:
+    """Stands in for a Grid in a worker, everything placement.place_offspring needs on arrays in shared memory.
+    No list of occupied points is kept, each band scans its own rows instead"""
+
+    def __init__(self, x_dim, y_dim, gene_length, ground, species_table, backend, arrays):
+        self.x_dim = x_dim
+        self.y_dim = y_dim
+        self.gene_length = gene_length
+        self.ground = ground
+        self.species_table = species_table
+        self.backend = backend
+        for name in shared:
+            setattr(self, name, arrays[name])
+        self.dispersal = neighbourhood.table(neighbourhood.dispersal_deltas, x_dim, y_dim)
+
+    @property
+    def shape(self):
+        return self.x_dim, self.y_dim
+
+    def place(self, cells, species):
+        self.species.ravel()[cells] = species
+        self.colour.ravel()[cells] = self.species_table.albedo[species]
+
+    def clear(self, cells):
+        self.colour.ravel()[cells] = self.ground
+        self.age.ravel()[cells] = NO_AGE
+        self.nutrients.ravel()[cells] = np.nan
+        self.genes.reshape(-1, self.gene_length)[cells] = NO_GENE
+        self.species.ravel()[cells] = NO_SPECIES
+
+
+class _Band:
+    """What a worker does with its band for each command it is sent"""
+
+    def __init__(self, grid, turns, y0, y1, halo, rng):
+        self.grid = grid
+        self.turns = turns
+        self.y0 = y0
+        self.y1 = y1
+        self.halo = halo
+        self.rng = rng
+        self.solar = kernels.solar_factor(np.arange(y0, y1), grid.y_dim)
+        # Diffusion reads one row past each edge of the band
+        self.lo = max(0, y0 - 1)
+        self.hi = min(grid.y_dim, y1 + 1)
+        self.neighbour_count = kernels.neighbour_counts(grid.shape, slice(self.lo, self.hi))
+        self.tally = np.zeros(len(grid.species_table) + 1, dtype=np.int64)
+        self.mature = np.empty(0, dtype=np.intp)
+
+    def temperature(self, a_d, lumen):
+        grid = self.grid
+        band = slice(self.y0, self.y1)
+        grid.local_temp[:, band] = kernels.local_temp(grid.colour[:, band], self.solar, a_d, lumen, Point.flux)
+
+    def grow(self):
+        """Same as Daisyworld.grow_daisies on the rows of the band
+
+        :rtype: tuple
+        :return: Sum of the temperature of the band, change to the count of each species, daisies that died and
+                 number of mature daisies
+        """
+        grid = self.grid
+        y0, y1 = self.y0, self.y1
+        temp_map = kernels.diffuse(grid.local_temp[:, self.lo:self.hi], self.neighbour_count)
+        temp_map = temp_map[:, y0 - self.lo:y1 - self.lo]
+        x, y = np.nonzero(grid.colour[:, y0:y1] != grid.ground)
+        daisies = x * grid.y_dim + y + y0
+        age = grid.age.ravel()
+        nutrients = grid.nutrients.ravel()
+
+        is_dying = age[daisies] >= Point.age_of_death
+        dying = daisies[is_dying]
+        tally = -np.bincount(grid.species.ravel()[dying] % len(self.tally), minlength=len(self.tally))
+        grid.clear(dying)
+        growing = daisies[~is_dying]
+        beta = kernels.beta_y(grid.opt_temp.ravel()[growing], temp_map[x[~is_dying], y[~is_dying]])
+        nutrients[growing] += 5 * beta
+        age[growing] += 1
+
+        adults = growing[age[growing] > Point.maturity_age]
+        mature = adults[nutrients[adults] > Point.req_resource]
+        # Shuffled so daisies closer to 0x0 do not get an advantage in selection
+        self.mature = mature[self.rng.permutation(len(mature))]
+        self.turns[:, y0:y1] = 0
+        self.turns.ravel()[mature] = WAITING
+        return float(np.sum(temp_map)), tally, len(dying), len(mature)
+
+    def reproduce(self):
+        """Same as batched Daisyworld.reproduce for the mature daisies of the band, mates can be in the halo
+
+        :rtype: tuple
+        :return: Change to the count of each species and number of children placed
+        """
+        grid = self.grid
+        turns = self.turns.ravel()
+        y_dim = grid.y_dim
+        # Daisies of the band taken as a mate by a band that went first have lost their turn
+        own = self.mature[turns[self.mature] == WAITING]
+        halo = []
+        for rows in (slice(max(0, self.y0 - self.halo), self.y0), slice(self.y1, min(y_dim, self.y1 + self.halo))):
+            x, y = np.nonzero(self.turns[:, rows] == WAITING)
+            halo.append(x * y_dim + y + rows.start)
+        coords = [divmod(cell, y_dim) for cell in np.concatenate([own] + halo).tolist()]
+        mates = grid.backend.mate_index(coords, Point.mate_range, grid.shape)
+
+        pairs = []
+        for parent in coords[:len(own)]:
+            if parent not in mates:
+                continue
+            mates.remove(parent)
+            turns[parent[0] * y_dim + parent[1]] = TURNED
+            best_mate = mates.best_mate(parent, grid.nutrients)
+            if best_mate is not None:
+                mates.remove(best_mate)
+                turns[best_mate[0] * y_dim + best_mate[1]] = TURNED
+            pairs.append((parent, best_mate))
+
+        tally = np.zeros_like(self.tally)
+        if pairs:
+            parents = np.array([x * y_dim + y for (x, y), mate in pairs], dtype=np.intp)
+            mate_cells = np.array([-1 if mate is None else mate[0] * y_dim + mate[1] for parent, mate in pairs],
+                                  dtype=np.intp)
+            tally[:-1] = placement.place_offspring(grid, parents, mate_cells, self.rng)
+        return tally, int(tally.sum())
+
+    def count(self):
+        return int(np.count_nonzero(self.grid.colour[:, self.y0:self.y1] != self.grid.ground))
+
+
+def _views(buffers, shape, gene_length, dtypes):
+    arrays = {}
+    for name, buffer in buffers.items():
+        full_shape = shape + ((gene_length,) if name == "genes" else ())
+        arrays[name] = np.frombuffer(buffer, dtype=dtypes[name], count=int(np.prod(full_shape))).reshape(full_shape)
+    return arrays
+
+
+def _serve(connection, buffers, dtypes, shape, gene_length, ground, species_table, backend, point_settings, y0, y1,
+           halo, seed):
+    # Runs in the worker process, carrying out commands until told to stop
+    for name, value in point_settings.items():
+        setattr(Point, name, value)
+    arrays = _views(buffers, shape, gene_length, dtypes)
+    grid = _BandGrid(shape[0], shape[1], gene_length, ground, species_table, backends.get(backend), arrays)
+    band = _Band(grid, arrays["turns"], y0, y1, halo, np.random.default_rng(seed))
+    while True:
+        command, args = connection.recv()
+        if command == "stop":
+            break
+        try:
+            connection.send(getattr(band, command)(*args))
+        except Exception as error:
+            # Sent back so the main process raises it rather than waiting forever
+            connection.send(error)
+    connection.close()
+
+
+class BandedWorld:
+    def __init__(self, world, bands=None, context=None):
+        """Moves a world into shared memory and starts a worker for each band. Use as a context manager, or call
+        close, to stop the workers and give the world its own arrays back
+
+        :param daisyworld.Daisyworld world: World to run, carries on from the luminosity it is up to
+        :param int bands: Number of bands, None for one per core. Fewer are used on a grid too short for them
+        :param context: multiprocessing context to start the workers with, None for the default
+        """
+        if world.sub_cycle:
+            # Bands go through whole luminosities, finish this one with Daisyworld.cycles first
+            raise ValueError("World is " + str(world.sub_cycle) + " cycles into a luminosity, bands start at the next")
+        self.world = world
+        self.halo = halo_rows()
+        self.edges = band_edges(world.y_dim, bands or os.cpu_count() or 1, self.halo)
+        context = context or multiprocessing.get_context()
+        grid = world.grid
+
+        # The world's grid is left looking at the shared arrays, so it can be inspected between cycles
+        buffers = {}
+        dtypes = {}
+        for name in shared:
+            array = getattr(grid, name)
+            buffers[name] = context.RawArray("b", max(1, array.nbytes))
+            dtypes[name] = array.dtype
+            view = np.frombuffer(buffers[name], dtype=array.dtype, count=array.size).reshape(array.shape)
+            view[...] = array
+            setattr(grid, name, view)
+        buffers["turns"] = context.RawArray("b", max(1, world.x_dim * world.y_dim))
+        dtypes["turns"] = np.dtype(np.int8)
+
+        # Every band gets its own stream, seeded from the world so a seeded world runs the same on as many bands
+        seeds = np.random.SeedSequence(world.random.getrandbits(64)).spawn(len(self.edges) - 1)
+        point_settings = {name: getattr(Point, name) for name in settings}
+        self._connections = []
+        self._workers = []
+        for i in range(len(self.edges) - 1):
+            connection, worker_end = context.Pipe()
+            worker = context.Process(target=_serve, daemon=True,
+                                     args=(worker_end, buffers, dtypes, grid.shape, grid.gene_length, grid.ground,
+                                           world.species, world.backend.name, point_settings, int(self.edges[i]),
+                                           int(self.edges[i + 1]), self.halo, seeds[i]))
+            worker.start()
+            worker_end.close()
+            self._connections.append(connection)
+            self._workers.append(worker)
+
+    def __len__(self):
+        return len(self._workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _send(self, command, *args, bands=None):
+        # Every band is sent the command before any reply is waited on, so they all work at once
+        bands = range(len(self._connections)) if bands is None else bands
+        for i in bands:
+            self._connections[i].send((command, args))
+        replies = [self._connections[i].recv() for i in bands]
+        for reply in replies:
+            if isinstance(reply, Exception):
+                raise reply
+        return replies
+
+    def step(self, lumen):
+        """Goes through one cycle of temperature, growth and reproduction on every band, like Daisyworld.step
+
+        :param double lumen: Solar luminosity
+
+        :rtype: CycleSummary
+        :return: Average temperature and albedo and number of each daisy after the cycle
+        """
+        world = self.world
+        profiler = world.profiler
+        profiler.start_cycle(world.position, lumen)
+        num_points = world.x_dim * world.y_dim
+        with profiler.phase("temperature", num_points):
+            self._send("temperature", world.calc_avg_albedo(), lumen)
+        with profiler.phase("growth", num_points):
+            grown = self._send("grow")
+        temp_sum = 0.0
+        mature = 0
+        for band_temp, tally, died, band_mature in grown:
+            temp_sum += band_temp
+            world.tally += tally
+            Point.alive_daisies -= died
+            mature += band_mature
+        if mature:
+            world.generation += 1
+            with profiler.phase("placement", mature):
+                for parity in (0, 1):
+                    for tally, born in self._send("reproduce", bands=range(parity, len(self), 2)):
+                        world.tally += tally
+                        Point.total_daisies += born
+                        Point.alive_daisies += born
+        world.cycle += 1
+        return CycleSummary(float(lumen), world.cycle, temp_sum / num_points, world.calc_avg_albedo(),
+                            tuple(world.counts.tolist()), world.species.names, self.population())
+
+    def population(self):
+        """Counts every daisy living on the grid
+
+        :rtype: int
+        :return: Number of daisies
+        """
+        return sum(self._send("count"))
+
+    def step_luminosity(self, lumen):
+        """Goes through all the cycles at one luminosity, like Daisyworld.step_luminosity
+
+        :param double lumen: Solar luminosity
+
+        :rtype: StepResult
+        :return: Temperature and albedo averaged over the cycles and number of each daisy at the end
+        """
+        world = self.world
+        summaries = [self.step(lumen) for t in range(world.cycles_per_lumen)]
+        avg_albedo = sum(summary.avg_albedo for summary in summaries) / len(summaries)
+        avg_temp = sum(summary.avg_temp for summary in summaries) / len(summaries)
+        return StepResult(float(lumen), avg_temp, avg_albedo, tuple(world.counts.tolist()), world.species.names)
+
+    def stream(self):
+        """Goes through the world's remaining luminosities, handing over the results of each one as it is done
+
+        :rtype: generator
+        :return: StepResult for each luminosity
+        """
+        world = self.world
+        while world.position < len(world.luminosities):
+            step = self.step_luminosity(world.luminosities[world.position])
+            world.position += 1
+            yield step
+
+    def run(self, result=None):
+        """Goes through every remaining luminosity, like Daisyworld.run
+
+        :param RunResult result: Results of the luminosities already gone through, to carry on a resumed run
+
+        :rtype: RunResult
+        :return: Average temperature, average albedo and number of each daisy at every luminosity
+        """
+        if result is None:
+            result = RunResult(self.world.luminosities[self.world.position:], self.world.species.names)
+        for step in self.stream():
+            result.record(step)
+        return result
+
+    def close(self):
+        """Stops the workers and copies the shared arrays back into the world, which can then carry on by itself"""
+        if not self._workers:
+            return
+        for connection in self._connections:
+            connection.send(("stop", ()))
+        for worker in self._workers:
+            worker.join()
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+        self._workers = []
+
+        world = self.world
+        grid = world.grid
+        for name in shared:
+            setattr(grid, name, getattr(grid, name).copy())
+        grid.rebuild_occupied()
+        if world.events is not None:
+            # The old schedule missed every birth and death while banded, start a new one from the ages on the grid
+            world.events = EventSchedule(grid, Point.age_of_death, Point.maturity_age)
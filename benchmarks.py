@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : benchmarks.py
+Date    : Friday 16 October 2026
+Desc.   : Times both Daisyworld models with fixed seeds so slowdowns are caught before they reach a long batch run.
+          Run with "python benchmarks.py", add --json to keep the timings and --compare to check them against a
+          previous run. Throughput of a short sweep of the enhanced model is in cell updates per second, one cell for
+          one cycle, a single cycle is timed in cycles per second and reproduction in mature daisies per second.
+History : 16/10/2026 - v1.0 - Created project file, added benchmarks of the classic sweep, one cycle, reproduction
+                              and a short sweep
+          16/10/2026 - v1.1 - One cycle timed on a spun up world with mature daisies, a fresh copy each time
+          16/10/2026 - v1.2 - Cycles and reproduction reported in cycles and daisies per second
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import argparse
+import copy
+import json
+import statistics
+import sys
+import time
+
+import numpy as np
+
+import simple_sweep
+from daisyworld import Daisyworld
+
+seed = 2020
+density = 350 / 2500  # Fraction of the grid enhanced_main starts with daisies on
+sizes = (50, 200, 1000)
+
+
+def make_world(size, luminosities=(0.8,), spin_up=0):
+    """Makes a seeded square world with the same starting density of daisies as enhanced_main
+
+    :param int size: Width and height of the grid
+    :param luminosities: Luminosity schedule
+    :param int spin_up: Cycles to go through first so there are mature daisies
+
+    :rtype: Daisyworld
+    :return: World ready to be timed
+    """
+    world = Daisyworld(size, size, list(luminosities), int(density * size * size), seed=seed)
+    for t in range(spin_up):
+        world.step(luminosities[0])
+    return world
+
+
+def measure(func, setup=None, repeat=5):
+    """Times func, calling setup before each call outside of the timing
+
+    :param func: Function to time, given whatever setup returns
+    :param setup: Function making the input of func, None for no input
+    :param int repeat: Number of times to call func
+
+    :rtype: dict
+    :return: Best and median time in seconds
+    """
+    times = []
+    for i in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        func(arg) if setup else func()
+        times.append(time.perf_counter() - start)
+    return {"best": min(times), "median": statistics.median(times), "repeat": repeat}
+
+
+def bench_classic_sweep(repeat):
+    # 100 settings of albedo over a shortened rise in luminosity
+    albedo_b, albedo_w = np.meshgrid(np.linspace(0.1, 0.45, 10), np.linspace(0.55, 0.9, 10))
+    timing = measure(lambda: simple_sweep.sweep(albedo_b, albedo_w, sim_length=55, resolution=1000), repeat=repeat)
+    timing["settings_steps_per_s"] = albedo_b.size * 55 * 1000 / timing["best"]
+    return timing
+
+
+def bench_cycle(size, repeat):
+    # Spun up until daisies are mature, so the cycle finds mates and places children. Each repeat steps its own copy so
+    # every time is of the same cycle
+    world = make_world(size, spin_up=Daisyworld.cycles_per_lumen * 2)
+    timing = measure(lambda copied: copied.step(0.8), lambda: copy.deepcopy(world), repeat=repeat)
+    timing["cycles_per_s"] = 1 / timing["best"]
+    return timing
+
+
+def bench_reproduction(size, repeat):
+    world = make_world(size, spin_up=Daisyworld.cycles_per_lumen * 2)
+
+    def setup():
+        copied = copy.deepcopy(world)
+        temp_map = copied.calc_temps(copied.calc_avg_albedo(), 0.8)
+        mature_daisies = copied.grow_daisies(temp_map)
+        copied.random.shuffle(mature_daisies)
+        return copied, mature_daisies
+
+    timing = measure(lambda arg: arg[0].reproduce(arg[1]), setup, repeat=repeat)
+    # Every copy is of the same world with the same random state, so has the same mature daisies
+    timing["daisies_per_s"] = len(setup()[1]) / timing["best"]
+    return timing
+
+
+def bench_short_sweep(size, repeat):
+    luminosities = [0.7, 0.8, 0.9]
+    timing = measure(lambda world: world.run(), lambda: make_world(size, luminosities), repeat=repeat)
+    timing["cell_updates_per_s"] = size * size * len(luminosities) * Daisyworld.cycles_per_lumen / timing["best"]
+    return timing
+
+
+def run_all(grid_sizes=sizes, repeat=5):
+    """Runs every benchmark
+
+    :param grid_sizes: Widths of the square grids to time the enhanced model at
+    :param int repeat: Number of times to time each benchmark, grids above 200 wide are only timed once
+
+    :rtype: dict
+    :return: Name of each benchmark to its timings, or to the error it failed with
+    """
+    benchmarks = [("classic_sweep", bench_classic_sweep, (repeat,))]
+    for size in grid_sizes:
+        size_repeat = repeat if size <= 200 else 1
+        benchmarks += [("cycle_" + str(size), bench_cycle, (size, size_repeat)),
+                       ("reproduction_" + str(size), bench_reproduction, (size, size_repeat)),
+                       ("short_sweep_" + str(size), bench_short_sweep, (size, size_repeat))]
+    results = {}
+    for name, bench, args in benchmarks:
+        try:
+            results[name] = bench(*args)
+        except Exception as error:
+            # One broken benchmark should not stop the others from being timed
+            results[name] = {"error": type(error).__name__ + ": " + str(error)}
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Finds benchmarks that got slower than a previous run
+
+    :param dict results: Timings of this run
+    :param dict baseline: Timings of the previous run
+    :param double threshold: How many times slower counts as a regression
+
+    :rtype: list
+    :return: Name, previous best and new best of every regression
+    """
+    return [(name, baseline[name]["best"], timing["best"]) for name, timing in results.items()
+            if "best" in timing and "best" in baseline.get(name, {}) and
+            timing["best"] > threshold * baseline[name]["best"]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(sizes), help="widths of the grids to time")
+    parser.add_argument("--repeat", type=int, default=5, help="times to time each benchmark")
+    parser.add_argument("--json", help="file to write the timings to")
+    parser.add_argument("--compare", help="timings from a previous run to check for regressions")
+    parser.add_argument("--threshold", type=float, default=1.2, help="slowdown counted as a regression")
+    args = parser.parse_args(argv)
+
+    results = run_all(args.sizes, args.repeat)
+    failed = False
+    for name, timing in results.items():
+        if "error" in timing:
+            print("%-22s FAILED %s" % (name, timing["error"]))
+            failed = True
+            continue
+        throughput = ", ".join("%s %.4g" % (key, value) for key, value in timing.items() if key.endswith("_per_s"))
+        print("%-22s best %9.4f s  median %9.4f s  %s" % (name, timing["best"], timing["median"], throughput))
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        for name, before, after in regressions:
+            print("REGRESSION %s: %.4f s -> %.4f s" % (name, before, after))
+        failed = failed or bool(regressions)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
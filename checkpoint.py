@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : checkpoint.py
+Date    : Friday 16 October 2026
+Desc.   : Saves the full state of an enhanced Daisyworld to a compressed .npz file and loads it back, so a long run
+          can be resumed after a crash or many experiments can be started from one planet that has already grown.
+History : 16/10/2026 - v1.0 - Created project file, added save and load
+          16/10/2026 - v1.1 - Occupied points worked out again after loading
+          16/10/2026 - v1.2 - Genes saved as allele codes, version 1 files with gene values still load
+          16/10/2026 - v1.3 - Species table, species of each point and the count of each species saved
+          16/10/2026 - v1.4 - State of the world's RandomStream saved, older files carry on with a stream seeded from
+                              their saved random module state
+          16/10/2026 - v1.5 - Whether the world places children in batches and schedules events saved, so a resumed
+                              world keeps the mode it was started in
+          16/10/2026 - v1.6 - Results saved with a count for every species, older files with counts of black, white
+                              and red still load
+          16/10/2026 - v1.7 - Cycle of the luminosity the world is partway through and the sums of the cycles gone
+                              through so far saved, so a world stopped between any two cycles resumes exactly
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import numpy as np
+
+import genome
+from daisyworld import Daisyworld
+from results import RunResult
+from species import NO_SPECIES, Species, SpeciesTable, with_grey
+from streams import RandomStream
+
+version = 7  # Bumped whenever the layout of the file changes
+grid_arrays = ("colour", "local_temp", "age", "nutrients", "opt_temp", "genes", "species")
+counters = ("generation", "cycle", "position", "sub_cycle", "init_pop")
+# Sums of the StatsTracker over the cycles of the luminosity the world is partway through
+stats_sums = ("cycles", "temp_total", "albedo_total")
+
+
+def save(world, path, result=None):
+    """Saves a world, along with the results of its run so far if given
+
+    :param Daisyworld world: World to save
+    :param str path: File to write, NumPy adds .npz if it is missing
+    :param RunResult result: Results of the luminosities the world has gone through
+    """
+    rng_state, rng_uniforms = world.random.getstate()
+    state = {
+        "version": version,
+        "dims": np.array([world.x_dim, world.y_dim]),
+        "luminosities": np.asarray(world.luminosities, dtype=float),
+        "rng_state": np.array(rng_state),
+        "rng_uniforms": rng_uniforms,
+        "batched": bool(world.batched),
+        "events": world.events is not None
+    }
+    for name in grid_arrays:
+        state["grid_" + name] = getattr(world.grid, name)
+    for name in counters:
+        state[name] = getattr(world, name)
+    for name in stats_sums:
+        state["stats_" + name] = getattr(world.stats, name)
+    table = world.species
+    state["tally"] = world.tally
+    state["species_names"] = np.array(table.names)
+    state["species_albedo"] = table.albedo[:-1]
+    state["species_genes"] = table.genes
+    state["species_offspring"] = np.array(table.offspring).reshape(-1, 2)
+    state["species_ground"] = table.ground
+    state["species_unpicked"] = NO_SPECIES if table.unpicked is None else table.unpicked
+    if result is not None:
+        for name in RunResult.columns:
+            state["result_" + name] = getattr(result, name)
+        state["result_filled"] = result.filled
+    np.savez_compressed(path, **state)
+
+
+def load(path, luminosities=None, seed=None):
+    """Loads a saved world, which goes on exactly as it would have done had it never been saved. Giving new
+    luminosities or a seed starts a new experiment from the saved planet instead
+
+    :param str path: File written by save
+    :param luminosities: New luminosity schedule, started from the beginning
+    :param int seed: New seed for the world's random number generator
+
+    :rtype: tuple
+    :return: The world and the RunResult saved with it, None if there was not one
+    """
+    with np.load(path) as state:
+        saved_version = int(state["version"])
+        if saved_version not in (1, 2, 3, 4, 5, 6, version):
+            raise ValueError("Checkpoint version " + str(saved_version) + " is not supported")
+        x_dim, y_dim = (int(dim) for dim in state["dims"])
+        schedule = state["luminosities"] if luminosities is None else luminosities
+        table = _species_table(state) if saved_version >= 3 else with_grey
+        # Files before version 5 did not record the mode, they load placing children one at a time as they always have
+        modes = {name: saved_version >= 5 and bool(state[name]) for name in ("batched", "events")}
+        world = Daisyworld(x_dim, y_dim, schedule, 0, species=table, **modes)
+        for name in grid_arrays:
+            if name == "species" and saved_version < 3:
+                # Before version 3 the species was only known from the albedo, grey daisies are never on the grid
+                # as they have the albedo of bare ground
+                saved = np.select([state["grid_colour"] == kind.albedo for kind in table[:2]], [0, 1], NO_SPECIES)
+            else:
+                saved = state["grid_" + name]
+            if name == "genes" and saved_version == 1:
+                # Version 1 held gene values with NaN for no daisy
+                saved = genome.encode(np.nan_to_num(saved))
+            getattr(world.grid, name)[...] = saved
+        # An event schedule is handed every daisy found here, so it starts from the ages that were saved
+        world.grid.rebuild_occupied()
+        for name in counters:
+            # Before version 7 worlds were only saved between luminosities
+            if name in state:
+                setattr(world, name, int(state[name]))
+        if saved_version >= 7:
+            world.stats.cycles = int(state["stats_cycles"])
+            world.stats.temp_total = float(state["stats_temp_total"])
+            world.stats.albedo_total = float(state["stats_albedo_total"])
+        if saved_version >= 3:
+            world.tally[...] = state["tally"]
+        else:
+            world.counts[...] = [int(state["num_b"]), int(state["num_w"]), int(state["num_r"])]
+
+        if seed is not None:
+            world.random = RandomStream(seed)
+        elif saved_version >= 4:
+            world.random = RandomStream()
+            world.random.setstate((str(state["rng_state"]), state["rng_uniforms"]))
+        else:
+            # Before version 4 the state was of the random module, which cannot be carried on by a NumPy
+            # generator, so it seeds one instead and the file still always resumes the same way
+            world.random = RandomStream([int(word) for word in state["rng_state"]])
+        world.grid.random = world.random
+
+        result = None
+        if luminosities is not None:
+            world.position = 0
+            world.sub_cycle = 0
+        elif "result_filled" in state:
+            result = RunResult(schedule, table.names)
+            for name in RunResult.columns:
+                if name == "counts" and saved_version < 6:
+                    # Before version 6 only black, white and red daisies were counted
+                    for index, kind in enumerate(table.names):
+                        if kind in ("black", "white", "red"):
+                            result.counts[:, index] = state["result_num_" + kind]
+                else:
+                    getattr(result, name)[...] = state["result_" + name]
+            result.filled = int(state["result_filled"])
+    return world, result
+
+
+def _species_table(state):
+    # Rebuilds the SpeciesTable a world was saved with
+    species = [Species(str(name), float(albedo), int(gene), tuple(int(n) for n in offspring))
+               for name, albedo, gene, offspring in zip(state["species_names"], state["species_albedo"],
+                                                        state["species_genes"], state["species_offspring"])]
+    unpicked = int(state["species_unpicked"])
+    return SpeciesTable(species, float(state["species_ground"]), None if unpicked == NO_SPECIES else unpicked)
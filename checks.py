@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : checks.py
+Date    : Friday 16 October 2026
+Desc.   : Checks the promises the faster code paths make about giving the same answers, run with "python checks.py".
+          The kernels of the numba backend are run as plain Python against the python backend, so they are checked
+          even without Numba installed. Seeded runs are compared across backends when Numba is installed, between
+          event scheduling and scanning ages, and between a run resumed from a checkpoint and one never stopped.
+History : 16/10/2026 - v1.0 - Created project file, added checks of the backends, events and checkpoints
+          16/10/2026 - v1.1 - Checks a world resumed partway through a luminosity
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import argparse
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+import backends
+import checkpoint
+from daisyworld import Daisyworld
+from results import RunResult
+from spatial_index import MateIndex, SortedMateIndex
+
+seed = 2020
+luminosities = (0.7, 0.75, 0.8, 0.85, 0.9, 0.95)
+# Modes of a world that each draw their random numbers in their own order
+modes = {"sequential": {}, "batched": {"batched": True}}
+
+
+class CheckFailed(Exception):
+    pass
+
+
+class Skipped(Exception):
+    pass
+
+
+def _same(what, first, second):
+    if not np.array_equal(first, second):
+        raise CheckFailed(what + " differ")
+
+
+def _same_run(what, first, second):
+    for name in RunResult.columns:
+        _same(what + " " + name, getattr(first, name)[:first.filled], getattr(second, name)[:second.filled])
+
+
+def make_world(size=30, **options):
+    """Makes a small seeded world
+
+    :param int size: Width and height of the grid
+    :param options: Keyword arguments of Daisyworld, such as batched, events or backend
+
+    :rtype: Daisyworld
+    :return: World
+    """
+    return Daisyworld(size, size, list(luminosities), int(0.14 * size * size), seed=seed, **options)
+
+
+def check_pick(rng):
+    # Rows summing to 1, rows of zeros and draws of exactly 0 and 1 as well as everything in between
+    probabilities = rng.random((500, 4))
+    probabilities /= probabilities.sum(axis=1, keepdims=True)
+    probabilities[::50] = 0
+    r = rng.integers(0, 11, size=500) / 10
+    expected = np.array([backends.roulette(row, draw) for row, draw in zip(probabilities, r)])
+    _same("python backend picks", backends.PythonBackend().pick(probabilities, r), expected)
+    _same("_pick picks", backends._pick(probabilities, r), expected)
+
+
+def check_settle(rng):
+    cells = np.sort(rng.integers(0, 60, size=400))
+    settled = rng.random(400) < 0.6
+    landed, last = backends.PythonBackend().settle(cells, settled)
+    kernel_landed, kernel_last = backends._settle(cells, settled)
+    _same("children landing", landed, kernel_landed)
+    _same("children left on their point", last, kernel_last)
+
+
+def check_best_mate(rng):
+    # Whole numbers of nutrients so fitnesses tie and the order of the daisies decides
+    shape = (30, 30)
+    cells = rng.choice(shape[0] * shape[1], size=300, replace=False)
+    coords = [divmod(int(cell), shape[1]) for cell in cells]
+    nutrients = rng.integers(0, 4, size=shape).astype(float)
+    radius = 7
+    bucketed = MateIndex(coords, radius)
+    sorted_index = SortedMateIndex(coords, radius, shape, backends._best_mate)
+    # Same order as Daisyworld.reproduce, each daisy and its mate leave the index
+    for coord in coords:
+        if coord not in bucketed:
+            continue
+        bucketed.remove(coord)
+        sorted_index.remove(coord)
+        mate = bucketed.best_mate(coord, nutrients)
+        if mate != sorted_index.best_mate(coord, nutrients):
+            raise CheckFailed("mates of " + str(coord) + " differ")
+        if mate is not None:
+            bucketed.remove(mate)
+            sorted_index.remove(mate)
+
+
+def check_backends(rng):
+    if "numba" not in _installed_backends():
+        raise Skipped("Numba is not installed")
+    for mode, options in modes.items():
+        _same_run(mode + " runs on each backend", make_world(backend="python", **options).run(),
+                  make_world(backend="numba", **options).run())
+
+
+def check_events(rng):
+    for mode, options in modes.items():
+        _same_run(mode + " runs with and without events", make_world(**options).run(),
+                  make_world(events=True, **options).run())
+
+
+def check_resume(rng):
+    for mode, options in dict(modes, events={"events": True}).items():
+        whole = make_world(**options).run()
+        world = make_world(**options)
+        result = RunResult(world.luminosities, world.species.names)
+        # range first, so zip stops before taking a step from the stream it will not record
+        for t, step in zip(range(len(luminosities) // 2), world.stream()):
+            result.record(step)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "world.npz")
+            checkpoint.save(world, path, result)
+            resumed, result = checkpoint.load(path)
+        _same_run(mode + " runs resumed from a checkpoint", resumed.run(result), whole)
+
+        # Stopped partway through a luminosity by cycles, the rest of the cycles come out the same
+        every_cycle = list(make_world(**options).cycles())
+        world = make_world(**options)
+        stop = 2 * world.cycles_per_lumen + 2
+        for t, summary in zip(range(stop), world.cycles()):
+            pass
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "world.npz")
+            checkpoint.save(world, path)
+            resumed, result = checkpoint.load(path)
+        if list(resumed.cycles()) != every_cycle[stop:]:
+            raise CheckFailed(mode + " cycles resumed partway through a luminosity differ")
+
+
+def _installed_backends():
+    installed = []
+    for name in backends.names:
+        try:
+            backends.get(name)
+        except ImportError:
+            continue
+        installed.append(name)
+    return installed
+
+
+checks = (("pick", check_pick), ("settle", check_settle), ("best_mate", check_best_mate),
+          ("backends", check_backends), ("events", check_events), ("resume", check_resume))
+
+
+def run_all():
+    """Runs every check
+
+    :rtype: dict
+    :return: Name of each check to "ok", or to why it was skipped or failed
+    """
+    results = {}
+    for name, check in checks:
+        try:
+            check(np.random.default_rng(seed))
+            results[name] = "ok"
+        except Skipped as reason:
+            results[name] = "skipped, " + str(reason)
+        except Exception as error:
+            # One failing check should not stop the others from running
+            results[name] = "FAILED " + type(error).__name__ + ": " + str(error)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args(argv)
+    results = run_all()
+    for name, outcome in results.items():
+        print("%-10s %s" % (name, outcome))
+    return 1 if any(outcome.startswith("FAILED") for outcome in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
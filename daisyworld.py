@@ -12,14 +12,47 @@ History : 26/11/2020 - v1.0 - Created project file, created and appropriately na
           17/12/2020 - v1.4 - Updated solar_factor method
           19/12/2020 - v1.5 - Added basic method calc_opt_temp to set an optimum temperature for each daisy
           23/12/2020 - v1.6 -
+          16/10/2026 - v1.7 - Point state moved into the arrays of a Grid, growth and death done for the whole grid
+          16/10/2026 - v1.8 - Temperature and diffusion worked out for the whole grid at once
+          16/10/2026 - v1.9 - Mates are found through a spatial index of mature daisies
+          16/10/2026 - v1.10 - Each world can have its own seeded random number generator, run returns its results
+          16/10/2026 - v1.11 - Results recorded in a RunResult and streamed per luminosity, graphs moved to plotting.py
+          16/10/2026 - v1.12 - Added step and cycles so a world can be driven one cycle at a time
+          16/10/2026 - v1.13 - Keeps track of its position in the luminosities so a run can be resumed
+          16/10/2026 - v1.14 - Each phase of a cycle can be timed by giving the world a PhaseProfiler
+          16/10/2026 - v1.15 - Growth, death and maturity only visit occupied points
+          16/10/2026 - v1.16 - Death and maturity can be scheduled ahead of time instead of checked every cycle
+          16/10/2026 - v1.17 - Children placed through the precomputed dispersal table
+          16/10/2026 - v1.18 - Children of a whole generation can be placed at once
+          16/10/2026 - v1.19 - Species come from a SpeciesTable and are counted in one array, replacing
+                               dw_without_grey.py
+          16/10/2026 - v1.20 - Solar factor follows the height of the world, so grids of any size and shape work
+          16/10/2026 - v1.21 - Mate search and batched placement run on a backend picked when the world is made
+          16/10/2026 - v1.22 - Random numbers drawn in blocks from the world's own NumPy generator, starting daisies
+                               placed all at once
+          16/10/2026 - v1.23 - Average temperature and the averages of each luminosity read from a StatsTracker
+          16/10/2026 - v1.24 - Results count every species of the table, num_b, num_w and num_r kept as aliases
+          16/10/2026 - v1.25 - cycles carries on from where the world got to and moves it on, so a world stopped
+                               partway through a luminosity saves and resumes where it was
+          16/10/2026 - v1.26 - Building the mate index profiled as its own phase
 
 """
 import math
-import random
 
 import numpy as np
-import matplotlib.pyplot as plt
-from point import Point
+
+import backends
+import genome
+import kernels
+import placement
+from events import EventSchedule
+from grid import Grid
+from point import Point, PointMap
+from profiling import null_profiler
+from results import CycleSummary, RunResult, StepResult
+from species import with_grey
+from stats import StatsTracker
+from streams import RandomStream
 
 __author__ = "Steven Diep"
 __maintainer__ = "Steven Diep"
@@ -28,40 +61,106 @@ __status__ = "Prototype"  # "Development" "Prototype" "Production"
 
 
 class Daisyworld:
-    def __init__(self, x_dim, y_dim, luminosities, init_pop):
-        self.num_b = 0  # Number of black daisies
-        self.num_w = 0  # Number of white daisies
-        self.num_r = 0  # Number of red daisies
+    cycles_per_lumen = 5  # Cycles of growth and reproduction before each rise in luminosity
+
+    def __init__(self, x_dim, y_dim, luminosities, init_pop, seed=None, profiler=None, events=False,
+                 batched=False, species=None, backend=None):
+        # Kinds of daisy that grow on this world, defaults to black, white and grey
+        self.species = with_grey if species is None else species
+        # Number of daisies of each species, with one more entry on the end that daisies of no species are added to
+        # so a count never needs a branch
+        self.tally = np.zeros(len(self.species) + 1, dtype=np.int64)
         self.x_dim = x_dim
         self.y_dim = y_dim
         self.luminosities = luminosities
         self.init_pop = init_pop
-        self.points = dict()
+        # Every world has its own stream, without a seed it starts from fresh entropy
+        self.random = RandomStream(seed)
+        # Compiled with Numba when it is installed, the results are the same on every backend
+        self.backend = backends.get(backend)
+        # Every attribute of every point is held in one array, self.points only hands out views onto it
+        self.grid = Grid(self.x_dim, self.y_dim, Point.gene_length, Point.ground, self.random, self.species,
+                         self.backend)
+        self.points = PointMap(self.grid)
+        # With events on, daisies are put in buckets for the cycle they die and mature in rather than having their
+        # age checked every cycle, the results are the same either way
+        self.events = EventSchedule(self.grid, Point.age_of_death, Point.maturity_age) if events else None
+        # Kept up to date by the grid on every birth and death, so statistics never need a pass over the grid
+        self.stats = StatsTracker(self.grid, Point.flux)
+        # Batched reproduction places every child of a generation together, it follows the same rules but draws its
+        # random numbers in a different order so does not give the same daisies as placing them one at a time
+        self.batched = batched
         self.generation = 0
+        self.cycle = 0  # Number of cycles gone through
+        self.position = 0  # Index of the next luminosity run and stream will go through
+        self.sub_cycle = 0  # Cycles of that luminosity already gone through by cycles
+        # Times each phase of a cycle, the null profiler does nothing when not profiling
+        self.profiler = null_profiler if profiler is None else profiler
+        # Neither depends on the daisies so are only worked out once
+        self.solar = kernels.solar_factor(np.arange(self.y_dim), self.y_dim)
+        self.neighbour_count = kernels.neighbour_counts(self.grid.shape)
 
-        a_d = self.calc_avg_albedo()
-        for x in range(self.x_dim):
-            for y in range(self.y_dim):
-                point = Point(x_coord=x,
-                              y_coord=y)
-                point.calc_temp(a_d, self.luminosities[0])
-                self.points[(x, y)] = point
-
-        i = 0
-        while i < self.init_pop:
-            x = random.randint(0, self.x_dim-1)
-            y = random.randint(0.2*self.y_dim, 0.8*self.y_dim-1)
-            daisy = self.points.get((x, y))
-            daisy.allocate_nutrients()
-            daisy.randomise_age()
-            daisy.grow_daisy()
-            if daisy.colour == Point.black:
-                self.num_b += 1
-            elif daisy.colour == Point.white:
-                self.num_w += 1
-            else:
-                self.num_r += 1
-            i += 1
+        self.calc_temps(self.calc_avg_albedo(), self.luminosities[0])
+        self.seed_daisies(self.init_pop)
+
+    def seed_daisies(self, init_pop):
+        """Scatters daisies with random genes, ages and nutrients over the middle of the planet, drawing them all
+        at once. A point picked more than once keeps the daisy drawn last, every daisy drawn is counted
+
+        :param int init_pop: Number of daisies
+        """
+        rng = self.random.generator
+        grid = self.grid
+        x = rng.integers(0, self.x_dim, init_pop)
+        y = rng.integers(int(0.2*self.y_dim), int(0.8*self.y_dim-1) + 1, init_pop)
+        nutrients = rng.integers(2, 6, init_pop)
+        ages = rng.integers(0, 16, init_pop)
+        genes = rng.integers(1, genome.codes + 1, (init_pop, Point.gene_length)).astype(np.uint8)
+        kinds = genome.expressed_species(genes, rng.integers(0, 11, init_pop) / 10, self.species, self.backend)
+        self.tally += np.bincount(kinds % len(self.tally), minlength=len(self.tally))
+        Point.total_daisies += init_pop
+        Point.alive_daisies += init_pop
+
+        cells = x * self.y_dim + y
+        # Position of the last draw of each point
+        last = len(cells) - 1 - np.unique(cells[::-1], return_index=True)[1]
+        cells = cells[last]
+        grid.genes.reshape(-1, Point.gene_length)[cells] = genes[last]
+        grid.nutrients.ravel()[cells] = nutrients[last]
+        grid.age.ravel()[cells] = ages[last]
+        colours = self.species.albedo[kinds[last]]
+        grid.opt_temp.ravel()[cells] = genome.expressed_opt_temp(genes[last], colours, grid.local_temp.ravel()[cells])
+        grid.place(cells, kinds[last])
+
+    @property
+    def counts(self):
+        # Number of daisies of each species, in the order of the species table
+        return self.tally[:-1]
+
+    def count_of(self, name):
+        """Number of daisies of one species
+
+        :param str name: Name of the species
+
+        :rtype: int
+        :return: Number of daisies, 0 if this world has no species of that name
+        """
+        index = self.species.index(name)
+        return 0 if index is None else int(self.tally[index])
+
+    # Counts of the black, white and red daisies of the default table, kept for code written before species tables.
+    # Results report counts for every species instead
+    @property
+    def num_b(self):
+        return self.count_of("black")
+
+    @property
+    def num_w(self):
+        return self.count_of("white")
+
+    @property
+    def num_r(self):
+        return self.count_of("red")
 
     def calc_avg_albedo(self):
         """Calculates average albedo of Daisyworld
@@ -70,202 +169,316 @@ class Daisyworld:
         :return: Average albedo with a range of 0 - 1
         """
         num_points = self.x_dim * self.y_dim
-        area_b = self.num_b/num_points
-        area_w = self.num_w/num_points
-        area_r = self.num_r/num_points
-        u_area = 1 - (area_b + area_w + area_r)
-        return Point.black*area_b + Point.white*area_w + Point.red*area_r + Point.ground*u_area
+        covered = 0
+        a_d = 0
+        for albedo, count in zip(self.species.albedo.tolist(), self.counts.tolist()):
+            area = count/num_points
+            covered += area
+            a_d += albedo*area
+        u_area = 1 - covered
+        return a_d + Point.ground*u_area
+
+    def calc_temps(self, a_d, lumen):
+        """Works out temperature at every point and smooths it over each point's neighbours
+
+        :param double a_d: Planetary albedo
+        :param double lumen: Solar luminosity
+
+        :rtype: numpy.ndarray
+        :return: Smoothed temperature of every point
+        """
+        self.grid.local_temp[...] = kernels.local_temp(self.grid.colour, self.solar, a_d, lumen, Point.flux)
+        return kernels.diffuse(self.grid.local_temp, self.neighbour_count)
 
     def find_diffuse_temp(self, neighbours, point):
         # Finds average temperature of point
         num_neighbours = len(neighbours) + 1
         total_temp = 0
         for neighbour in neighbours:
-            total_temp += self.points.get(neighbour).local_temp
+            total_temp += self.grid.local_temp[neighbour]
         return (total_temp + point)/num_neighbours
 
-    def run(self):
-        avg_temps = []
-        avg_albedos = []
-        num_black = []
-        num_white = []
-        num_red = []
-        for lumen in self.luminosities:
-            avg_albedo_per_cycle = []
-            avg_temps_per_cycle = []
-            t = 0
-            # Goes through 5 cycles before rise in luminosity
-            while t < 5:
-                a_d = self.calc_avg_albedo()
-                temp_map = []
-                mature_daisies = []
-                for x in range(self.x_dim):
-                    y_map = []
-                    for y in range(self.y_dim):
-                        point = self.points.get((x, y))
-                        point.calc_temp(a_d, lumen)
-                        neighbours = point.find_neighbours()
-                        smoothed_temp = self.find_diffuse_temp(neighbours, point.local_temp)
-                        y_map.append(smoothed_temp)
-                        # If it is a daisy, grow
-                        if not point.check_pos():
-                            beta = point.beta_y(smoothed_temp)
-                            alive = point.grow(beta)
-                            if not alive:
-                                if point.colour == Point.black:
-                                    self.num_b -= 1
-                                elif point.colour == Point.white:
-                                    self.num_w -= 1
-                                else:
-                                    self.num_r -= 1
-                                point.colour = Point.ground
-                            if point.age is None:
-                                pass
-                            elif point.age > Point.maturity_age and point.nutrients > Point.req_resource:
-                                mature_daisies.append((x, y))
-                    temp_map.append(y_map)
-                # Randomise list of mature daisies so daisies closer to 0x0 will
-                # not get an advantage in selection process
-                random.shuffle(mature_daisies)
-                # Selection phase happens
-                if not mature_daisies:
-                    continue
-                # Now we have a set of mature daisies
-                self.generation += 1
-                # Begin selection process
-                index = 0
-                while index < len(mature_daisies):
-                    # Sexually reproducing should be more favourable than clonally reproducing,
-                    # however, daisy must be a certain age and have enough nutrients
-                    best_fitness = 0
-                    best_mate = []
-                    # Perform a search for best mate available within a range
-                    # Certainly not the best method of selection but I am short on time
-                    # Work out fitness in terms of locality and resources
-                    for i in range(1, len(mature_daisies)):
-                        x1, y1 = mature_daisies[index]
-                        x2, y2 = mature_daisies[i]
-                        # Works out Euclidean distance between daisies
-                        locality = math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
-                        fitness = self.points.get(mature_daisies[i]).nutrients / locality
-                        # Daisies that are too far are not counted
-                        # Wanted locality to also be a gene trait but not enough time
-                        if locality <= 7 and fitness > best_fitness:
-                            best_fitness = fitness
-                            best_mate.append(mature_daisies[index + 1])
-                    # If no mates are found for daisy in list, clonally reproduce
-                    if not best_mate:
-                        clones = random.randint(0, 2)
-                        # Daisy can fail to have offspring
-                        if clones == 0:
-                            self.points.get(mature_daisies[index]).nutrients -= Point.clonal_cost
-                            mature_daisies.remove(mature_daisies[index])
-                            continue
-                        possible_points = self.points.get(mature_daisies[index]).possible_points()
-                        for clone in range(clones):
-                            while True:
-                                # Randomly allocated position for child daisy
-                                allocated_position = random.choice(possible_points)
-                                child_daisy = self.points.get(allocated_position)
-                                # Checks if daisy is already present on point, if present then remove coordinate
-                                if not child_daisy.check_pos():
-                                    # All possible areas are occupied by daisies
-                                    # This daisy died from overcrowding
-                                    break
-                                elif child_daisy.check_pos():
-                                    # Set coordinates of child
-                                    child_genes = self.points.get(mature_daisies[index]).genes
-                                    child_daisy.grow_daisy(child_genes)
-                                    child_daisy.age = 0
-                                    child_daisy.allocate_nutrients()
-                                    # Asexual reproduction does not introduce enough variety
-                                    # to planet, therefore, higher mutation rate for selfing is increased from 1% to 5%
-                                    child_daisy.mutate_high()
-                                    if child_daisy.colour == Point.black:
-                                        self.num_b += 1
-                                    elif child_daisy.colour == Point.white:
-                                        self.num_w += 1
-                                    else:
-                                        self.num_r += 1
-                                    break
-                        self.points.get(mature_daisies[index]).nutrients -= Point.clonal_cost
-                        mature_daisies.remove(mature_daisies[index])
-                    else:
-                        # Reproduce here, can produce between 0 - 3 children
-                        daisy = self.points.get(mature_daisies[index])
-                        # Final element of the best_mate list is always most fit daisy
-                        daisy_mate = self.points.get(best_mate[-1]).genes
-                        children = random.randint(0, 2)
-                        if children == 0:
-                            self.points.get(mature_daisies[index]).nutrients -= Point.sexual_cost
-                            mature_daisies.remove(mature_daisies[index])
-                            self.points.get(best_mate[-1]).nutrients -= Point.sexual_cost
-                            mature_daisies.remove(best_mate[-1])
-                            continue
-                        # Get midpoint between parents
-                        x1, y1 = mature_daisies[index]
-                        x2, y2 = best_mate[-1]
-                        x_mid = math.floor((x1 + x2)/2)
-                        y_mid = math.floor((y1 + y1)/2)
-                        # Find range around midpoint for dispersal
-                        possible_points = self.points.get((x_mid, y_mid)).possible_points()
-                        for child in range(children):
-                            while True:
-                                # Randomly allocated position for child daisy
-                                allocated_position = random.choice(possible_points)
-                                child_daisy = self.points.get(allocated_position)
-                                if not child_daisy.check_pos():
-                                    # All possible areas are occupied by daisies
-                                    # This daisy died from overcrowding
-                                    break
-                                elif child_daisy.check_pos():
-                                    # Set coordinates of child
-                                    child_genes = daisy.s_reproduce(daisy_mate)
-                                    child_daisy.grow_daisy(child_genes)
-                                    child_daisy.age = 0
-                                    child_daisy.allocate_nutrients()
-                                    child_daisy.mutate_low()
-                                    if child_daisy.colour == Point.black:
-                                        self.num_b += 1
-                                    elif child_daisy.colour == Point.white:
-                                        self.num_w += 1
-                                    else:
-                                        self.num_r += 1
-                                    break
-                        self.points.get(mature_daisies[index]).nutrients -= Point.sexual_cost
-                        mature_daisies.remove(mature_daisies[index])
-                        self.points.get(best_mate[-1]).nutrients -= Point.sexual_cost
-                        mature_daisies.remove(best_mate[-1])
-                t += 1
-                num_points = self.x_dim * self.y_dim
-                total_temp = np.sum(temp_map)
-                avg_planet_temp = total_temp/num_points
-                avg_albedo_per_cycle.append(self.calc_avg_albedo())
-                avg_temps_per_cycle.append(avg_planet_temp)
-            avg_albedo = sum(avg_albedo_per_cycle) / len(avg_albedo_per_cycle)
-            avg_albedos.append(avg_albedo)
-            avg_temp = sum(avg_temps_per_cycle) / len(avg_temps_per_cycle)
-            avg_temps.append(avg_temp)
-            num_black.append(self.num_b)
-            num_white.append(self.num_w)
-            num_red.append(self.num_r)
-        plt.plot(self.luminosities, avg_temps, 'b')
-        plt.title('Temperature over luminosity')
-        plt.xlabel('Solar Luminosity')
-        plt.ylabel('Temperature (°C)')
-        plt.show()
-
-        plt.plot(self.luminosities, avg_albedos, 'b')
-        plt.title('Average albedo over luminosity')
-        plt.xlabel('Solar Luminosity')
-        plt.ylabel('Albedo')
-        plt.show()
-
-        plt.plot(self.luminosities, num_black, 'b', label='Black daisies')
-        plt.plot(self.luminosities, num_white, 'g', label='White daisies')
-        plt.plot(self.luminosities, num_red, 'r', label='Grey daisies')
-        plt.legend(loc='upper right')
-        plt.title('Number of daisies over luminosity')
-        plt.xlabel('Solar Luminosity')
-        plt.ylabel('Count')
-        plt.show()
+    def grow_daisies(self, temp_map):
+        """Ages every daisy on the grid, daisies past their age of death return to bare ground
+
+        :param numpy.ndarray temp_map: Smoothed temperature of every point
+
+        :rtype: list
+        :return: Coordinates of daisies mature enough and with enough nutrients to reproduce
+        """
+        grid = self.grid
+        profiler = self.profiler
+        # Flat views so only the occupied points are touched, work scales with the daisies rather than the grid
+        age = grid.age.ravel()
+        nutrients = grid.nutrients.ravel()
+        with profiler.phase("growth", grid.count):
+            if self.events is None:
+                daisies = grid.occupied()
+                is_dying = age[daisies] >= Point.age_of_death
+                growing = daisies[~is_dying]
+                self.kill(daisies[is_dying])
+            else:
+                # Dying daisies are cleared first so every daisy left on the grid grows
+                self.kill(self.events.dying())
+                growing = grid.occupied()
+
+            beta = kernels.beta_y(grid.opt_temp.ravel()[growing], temp_map.ravel()[growing])
+            nutrients[growing] += 5 * beta
+            age[growing] += 1
+
+        with profiler.phase("collect", len(growing)):
+            if self.events is None:
+                adults = growing[age[growing] > Point.maturity_age]
+            else:
+                adults = self.events.mature()
+            mature = adults[nutrients[adults] > Point.req_resource]
+            # Sorted so the daisies come out in the same order as a scan of the grid would find them
+            mature.sort()
+            return list(zip((mature // self.y_dim).tolist(), (mature % self.y_dim).tolist()))
+
+    def kill(self, dying):
+        """Returns daisies to bare ground and takes them off the count of each colour
+
+        :param numpy.ndarray dying: Flat indices of the daisies
+        """
+        if len(dying):
+            self.tally -= np.bincount(self.grid.species.ravel()[dying] % len(self.tally), minlength=len(self.tally))
+            Point.alive_daisies -= len(dying)
+            self.grid.clear(dying)
+
+    def run(self, result=None):
+        """Goes through every luminosity, with 5 cycles of growth and reproduction at each
+
+        :param RunResult result: Results of the luminosities already gone through, to carry on a resumed run
+
+        :rtype: RunResult
+        :return: Average temperature, average albedo and number of each daisy at every luminosity
+        """
+        if result is None:
+            result = RunResult(self.luminosities[self.position:], self.species.names)
+        for step in self.stream():
+            result.record(step)
+        return result
+
+    def stream(self):
+        """Goes through every luminosity like run, handing over the results of each one as soon as it is done.
+        Starts from where the world got to, so a loaded checkpoint carries on where it was saved, even partway through
+        a luminosity
+
+        :rtype: generator
+        :return: StepResult for each luminosity
+        """
+        while self.position < len(self.luminosities):
+            lumen = self.luminosities[self.position]
+            self._next_cycle()
+            while self.sub_cycle:
+                self._next_cycle()
+            yield self._step_result(lumen)
+
+    def cycles(self, luminosities=None):
+        """Goes through luminosities one cycle at a time, so it can be stopped between any two cycles
+
+        :param luminosities: Luminosities to go through, defaults to the rest of the ones the world was made with,
+                             carrying on from the cycle the world got to. Other luminosities do not move the world on
+
+        :rtype: generator
+        :return: CycleSummary for each cycle
+        """
+        if luminosities is None:
+            while self.position < len(self.luminosities):
+                yield self._next_cycle()
+            return
+        for lumen in luminosities:
+            for t in range(self.cycles_per_lumen):
+                yield self.step(lumen)
+
+    def _next_cycle(self):
+        # One cycle of the luminosity the world is at, moving on to the next luminosity after its last cycle
+        if self.sub_cycle == 0:
+            self.stats.start_luminosity()
+        summary = self.step(self.luminosities[self.position])
+        self.sub_cycle += 1
+        if self.sub_cycle == self.cycles_per_lumen:
+            self.sub_cycle = 0
+            self.position += 1
+        return summary
+
+    def step_luminosity(self, lumen):
+        """Goes through all the cycles at one luminosity
+
+        :param double lumen: Solar luminosity
+
+        :rtype: StepResult
+        :return: Temperature and albedo averaged over the cycles and number of each daisy at the end
+        """
+        self.stats.start_luminosity()
+        for t in range(self.cycles_per_lumen):
+            self.step(lumen)
+        return self._step_result(lumen)
+
+    def _step_result(self, lumen):
+        avg_temp, avg_albedo = self.stats.luminosity_means()
+        return StepResult(float(lumen), avg_temp, avg_albedo, tuple(self.counts.tolist()), self.species.names)
+
+    def step(self, lumen):
+        """Goes through one cycle of temperature, growth and reproduction
+
+        :param double lumen: Solar luminosity
+
+        :rtype: CycleSummary
+        :return: Average temperature and albedo and number of each daisy after the cycle
+        """
+        profiler = self.profiler
+        profiler.start_cycle(self.position, lumen)
+        with profiler.phase("temperature", self.x_dim * self.y_dim):
+            a_d = self.calc_avg_albedo()
+            temp_map = self.calc_temps(a_d, lumen)
+            # Read before growth and reproduction change the grid the temperature was worked out from
+            avg_planet_temp = self.stats.avg_temp(a_d, lumen)
+        mature_daisies = self.grow_daisies(temp_map)
+        # Randomise list of mature daisies so daisies closer to 0x0 will
+        # not get an advantage in selection process
+        with profiler.phase("shuffle", len(mature_daisies)):
+            self.random.shuffle(mature_daisies)
+        # Selection phase happens, but only if there is at least one mature daisy
+        if mature_daisies:
+            self.reproduce(mature_daisies)
+        self.cycle += 1
+        avg_albedo = self.calc_avg_albedo()
+        self.stats.add_cycle(avg_planet_temp, avg_albedo)
+        return CycleSummary(float(lumen), self.cycle, avg_planet_temp, avg_albedo, tuple(self.counts.tolist()),
+                            self.species.names, self.population())
+
+    def population(self):
+        """Counts every daisy living on the grid
+
+        :rtype: int
+        :return: Number of daisies, 0 once the planet has died out
+        """
+        return self.grid.count
+
+    def reproduce(self, mature_daisies):
+        """Selection phase, every mature daisy either finds a mate or reproduces clonally
+
+        :param list mature_daisies: Coordinates of mature daisies, in the order they get to pick a mate
+        """
+        profiler = self.profiler
+        self.generation += 1
+        # Begin selection process, daisies take turns in the shuffled order and each
+        # one taken as a mate loses its own turn
+        # Timed apart from mate_search, so mate_search counts each turn once
+        with profiler.phase("mate_index", len(mature_daisies)):
+            mates = self.backend.mate_index(mature_daisies, Point.mate_range, self.grid.shape)
+        pairs = []  # Parent and mate of every turn, only kept when batched
+        for parent in mature_daisies:
+            if parent not in mates:
+                continue
+            mates.remove(parent)
+            # Sexually reproducing should be more favourable than clonally reproducing,
+            # however, daisy must be a certain age and have enough nutrients
+            # Work out fitness in terms of locality and resources, daisies that are too far are not counted
+            # Wanted locality to also be a gene trait but not enough time
+            with profiler.phase("mate_search", 1):
+                best_mate = mates.best_mate(parent, self.grid.nutrients)
+            if self.batched:
+                if best_mate is not None:
+                    mates.remove(best_mate)
+                pairs.append((parent, best_mate))
+            # If no mates are found for daisy in list, clonally reproduce
+            elif best_mate is None:
+                with profiler.phase("clonal", 1):
+                    self.reproduce_clonally(parent)
+            else:
+                mates.remove(best_mate)
+                with profiler.phase("sexual", 2):
+                    self.reproduce_sexually(parent, best_mate)
+        if pairs:
+            with profiler.phase("placement", len(pairs)):
+                self.place_offspring(pairs)
+
+    def place_offspring(self, pairs):
+        """Batched reproduction, every turn has its children placed together
+
+        :param list pairs: Coordinates of the daisy and its mate for each turn, mate None for clonal reproduction
+        """
+        parents = np.array([x * self.y_dim + y for (x, y), mate in pairs], dtype=np.intp)
+        mates = np.array([-1 if mate is None else mate[0] * self.y_dim + mate[1] for parent, mate in pairs],
+                         dtype=np.intp)
+        # Drawn from the world's generator so a seeded world is still reproducible, checkpoints included
+        self.counts[...] += placement.place_offspring(self.grid, parents, mates, self.random.generator)
+
+    def reproduce_clonally(self, parent):
+        """Daisy without a mate has clones around itself, as many as the range of its species allows
+
+        :param tuple parent: Coordinates of the daisy
+        """
+        clones = self.random.randint(*self.species.offspring[self.points.get(parent).species])
+        # Daisy can fail to have offspring
+        if clones == 0:
+            self.points.get(parent).nutrients -= Point.clonal_cost
+            return
+        possible_points = self.grid.dispersal(parent[0] * self.y_dim + parent[1])
+        for clone in range(clones):
+            while True:
+                # Randomly allocated position for child daisy
+                allocated_position = self.random.choice(possible_points)
+                child_daisy = self.points.get(divmod(int(allocated_position), self.y_dim))
+                # Checks if daisy is already present on point, if present then remove coordinate
+                if not child_daisy.check_pos():
+                    # All possible areas are occupied by daisies
+                    # This daisy died from overcrowding
+                    break
+                elif child_daisy.check_pos():
+                    # Set coordinates of child
+                    child_genes = self.points.get(parent).genes
+                    child_daisy.grow_daisy(child_genes)
+                    child_daisy.age = 0
+                    child_daisy.allocate_nutrients()
+                    # Asexual reproduction does not introduce enough variety
+                    # to planet, therefore, higher mutation rate for selfing is increased from 1% to 5%
+                    child_daisy.mutate_high()
+                    self.tally[child_daisy.species] += 1
+                    break
+        self.points.get(parent).nutrients -= Point.clonal_cost
+
+    def reproduce_sexually(self, parent, best_mate):
+        """Two daisies have children around the point between them, as many as the range of its species allows
+
+        :param tuple parent: Coordinates of the daisy picking a mate
+        :param tuple best_mate: Coordinates of the mate it picked
+        """
+        # Reproduce here, can produce between 0 - 3 children
+        daisy = self.points.get(parent)
+        daisy_mate = self.points.get(best_mate).genes
+        children = self.random.randint(*self.species.offspring[daisy.species])
+        if children == 0:
+            daisy.nutrients -= Point.sexual_cost
+            self.points.get(best_mate).nutrients -= Point.sexual_cost
+            return
+        # Get midpoint between parents
+        x1, y1 = parent
+        x2, y2 = best_mate
+        x_mid = math.floor((x1 + x2)/2)
+        y_mid = math.floor((y1 + y1)/2)
+        # Find range around midpoint for dispersal
+        possible_points = self.grid.dispersal(x_mid * self.y_dim + y_mid)
+        for child in range(children):
+            while True:
+                # Randomly allocated position for child daisy
+                allocated_position = self.random.choice(possible_points)
+                child_daisy = self.points.get(divmod(int(allocated_position), self.y_dim))
+                if not child_daisy.check_pos():
+                    # All possible areas are occupied by daisies
+                    # This daisy died from overcrowding
+                    break
+                elif child_daisy.check_pos():
+                    # Set coordinates of child
+                    child_genes = daisy.s_reproduce(daisy_mate)
+                    child_daisy.grow_daisy(child_genes)
+                    child_daisy.age = 0
+                    child_daisy.allocate_nutrients()
+                    child_daisy.mutate_low()
+                    self.tally[child_daisy.species] += 1
+                    break
+        daisy.nutrients -= Point.sexual_cost
+        self.points.get(best_mate).nutrients -= Point.sexual_cost
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : ensemble.py
+Date    : Friday 16 October 2026
+Desc.   : Runs many independent copies of the enhanced Daisyworld across a pool of processes and summarises them.
+          Every member gets its own random number stream spawned from one seed, so an ensemble can be reproduced
+          exactly no matter how many processes it is spread over.
+History : 16/10/2026 - v1.0 - Created project file, added run_ensemble and EnsembleResult
+          16/10/2026 - v1.1 - Members can run any species table, the count of every species is kept
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import daisyworld
+from results import CountAliases
+
+# Columns of the RunResult kept for every member
+fields = ("avg_temp", "avg_albedo", "counts")
+
+
+class EnsembleResult(CountAliases):
+    def __init__(self, luminosity, seeds, runs):
+        self.luminosity = luminosity  # Luminosity of every member at each step, shape (members, steps)
+        self.seeds = seeds  # Seed each member was run with
+        self.names = runs[0].names  # Species counted, every member runs the same table
+        # One array of shape (members, steps) for each of the fields, counts has another axis for the species
+        for name in fields:
+            setattr(self, name, np.array([getattr(run, name) for run in runs], dtype=float))
+
+    def __len__(self):
+        return len(self.seeds)
+
+    def count_of(self, name):
+        """Number of daisies of one species for every member at each luminosity
+
+        :param str name: Name of the species
+
+        :rtype: numpy.ndarray
+        :return: Counts of shape (members, steps), all 0 if the members have no species of that name
+        """
+        if name not in self.names:
+            return np.zeros(self.luminosity.shape)
+        return self.counts[:, :, self.names.index(name)]
+
+    def _column(self, name):
+        return self.count_of(name) if name in self.names else getattr(self, name)
+
+    def mean(self, name):
+        """Mean over every member at each luminosity
+
+        :param str name: One of fields, or the name of a species
+
+        :rtype: numpy.ndarray
+        :return: Mean at each luminosity
+        """
+        return self._column(name).mean(axis=0)
+
+    def quantile(self, name, q):
+        """Quantiles over every member at each luminosity
+
+        :param str name: One of fields, or the name of a species
+        :param q: Quantile or sequence of quantiles between 0 - 1
+
+        :rtype: numpy.ndarray
+        :return: Quantiles at each luminosity, shape (len(q), steps) for a sequence of quantiles
+        """
+        return np.quantile(self._column(name), q, axis=0)
+
+
+def run_member(x_dim, y_dim, luminosities, init_pop, seed, species=None):
+    """Runs one member of an ensemble, at module level so it can be sent to another process
+
+    :param int x_dim: Width of the grid
+    :param int y_dim: Height of the grid
+    :param luminosities: Luminosity schedule
+    :param int init_pop: Number of daisies to start with
+    :param int seed: Seed for the member's random number generator
+    :param species.SpeciesTable species: Kinds of daisy that grow, None for black, white and grey
+
+    :rtype: results.RunResult
+    :return: Results of Daisyworld.run
+    """
+    world = daisyworld.Daisyworld(x_dim, y_dim, luminosities, init_pop, seed=seed, species=species)
+    return world.run()
+
+
+def member_seeds(members, seed=None):
+    """Spawns an independent random number stream for every member from one seed
+
+    :param int members: Number of members
+    :param int seed: Seed of the whole ensemble, None for a fresh one from the operating system
+
+    :rtype: list
+    :return: One integer seed per member
+    """
+    children = np.random.SeedSequence(seed).spawn(members)
+    return [int(child.generate_state(1, dtype=np.uint64)[0]) for child in children]
+
+
+def run_ensemble(members, luminosities, x_dim=50, y_dim=50, init_pop=350, seed=None, processes=None, species=None):
+    """Runs members independent worlds across a pool of processes
+
+    :param int members: Number of worlds to run
+    :param luminosities: Luminosity schedule shared by every member, or a list with one schedule per member. Every
+                         schedule must be the same length so the members can be summarised together
+    :param int x_dim: Width of the grid
+    :param int y_dim: Height of the grid
+    :param init_pop: Number of daisies to start with, or a list with one per member
+    :param int seed: Seed of the whole ensemble
+    :param int processes: Number of processes, None for one per core and 1 to run everything in this process
+    :param species.SpeciesTable species: Kinds of daisy every member grows, None for black, white and grey
+
+    :rtype: EnsembleResult
+    :return: Results of every member
+    """
+    if np.ndim(luminosities[0]) == 0:
+        schedules = [np.asarray(luminosities, dtype=float)] * members
+    elif len(luminosities) == members:
+        schedules = [np.asarray(schedule, dtype=float) for schedule in luminosities]
+    else:
+        raise ValueError("Need one luminosity schedule or one per member, got " + str(len(luminosities)))
+    if len(set(map(len, schedules))) != 1:
+        raise ValueError("Every luminosity schedule must be the same length")
+    populations = [init_pop] * members if np.ndim(init_pop) == 0 else list(init_pop)
+    if len(populations) != members:
+        raise ValueError("Need one initial population or one per member, got " + str(len(populations)))
+    seeds = member_seeds(members, seed)
+
+    jobs = ([x_dim] * members, [y_dim] * members, schedules, populations, seeds, [species] * members)
+    if processes == 1:
+        runs = list(map(run_member, *jobs))
+    else:
+        workers = processes or os.cpu_count() or 1
+        with ProcessPoolExecutor(workers) as pool:
+            runs = list(pool.map(run_member, *jobs, chunksize=max(1, members // (4 * workers))))
+    return EnsembleResult(np.array(schedules), seeds, runs)
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : equilibrium.py
+Date    : Friday 16 October 2026
+Desc.   : Steady states of the classic Daisyworld in simple_daisyworld.py found directly instead of by stepping
+          through time. At a steady state each daisy has either died out or grows exactly as fast as it dies,
+          x * beta = gamma. Fixing the area of one daisy fixes its local temperature through beta_y, which fixes the
+          planetary temperature and in turn the luminosity needed, so every branch of steady states can be followed
+          through luminosity by stepping along the daisy area. This goes round the folds where the luminosity turns
+          back on itself, which is where Daisyworld shows hysteresis.
+History : 16/10/2026 - v1.0 - Created project file, added branches, folds and stability of steady states
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import numpy as np
+
+import simple_daisyworld as simple
+import simple_sweep
+
+sigma = 5.67037e-8  # Stefan-Boltzmann constant
+abs_zero = 273.15  # Used to calculate temperature in celsius
+
+
+class Settings:
+    def __init__(self, a_b=0.25, a_w=0.75, a_g=0.5, flux=1050, c=0.003265, gamma=0.3, opt_temp=22.5, q=20):
+        self.a_b = a_b  # Albedo of black daisy
+        self.a_w = a_w  # Albedo of white daisy
+        self.a_g = a_g  # Albedo of bare ground
+        self.flux = flux  # Solar flux constant
+        self.c = c  # Quadratic width of beta_y
+        self.gamma = gamma  # Death rate of both daisies
+        self.opt_temp = opt_temp  # Optimum temperature for black and white daisies
+        self.q = q  # Heat absorption coefficient
+
+    def rates(self, area_b, area_w, lumen):
+        """Rate of change of both daisies, the same equations as simple_daisyworld.derivatives for arrays
+
+        :param numpy.ndarray area_b: Fraction of surface area for black daisies
+        :param numpy.ndarray area_w: Fraction of surface area for white daisies
+        :param numpy.ndarray lumen: Solar luminosity
+
+        :rtype: tuple
+        :return: Rate of change of black daisies and of white daisies
+        """
+        x = simple.uncolonised_ground(area_b, area_w)
+        a_d = simple.planetary_albedo(area_b, area_w, x, a_b=self.a_b, a_w=self.a_w, a_g=self.a_g)
+        temp_d = simple.planetary_temp(self.flux, lumen, a_d)
+        beta_b = simple_sweep.beta_y(simple.local_temp(self.a_b, a_d, temp_d, q=self.q), self.opt_temp, self.c)
+        beta_w = simple_sweep.beta_y(simple.local_temp(self.a_w, a_d, temp_d, q=self.q), self.opt_temp, self.c)
+        return (simple.daisy_growth(area_b, x, beta_b, self.gamma),
+                simple.daisy_growth(area_w, x, beta_w, self.gamma))
+
+    def stable(self, area_b, area_w, lumen, e=1e-7):
+        """Checks if steady states are stable, both eigenvalues of the Jacobian have negative real parts when its
+        trace is negative and its determinant positive
+
+        :param numpy.ndarray area_b: Fraction of surface area for black daisies
+        :param numpy.ndarray area_w: Fraction of surface area for white daisies
+        :param numpy.ndarray lumen: Solar luminosity
+        :param double e: Step used for the finite differences
+
+        :rtype: numpy.ndarray
+        :return: True for each stable steady state
+        """
+        db_b, dw_b = np.subtract(self.rates(area_b + e, area_w, lumen), self.rates(area_b - e, area_w, lumen))
+        db_w, dw_w = np.subtract(self.rates(area_b, area_w + e, lumen), self.rates(area_b, area_w - e, lumen))
+        trace = (db_b + dw_w) / (2 * e)
+        det = (db_b * dw_w - db_w * dw_b) / (2 * e) ** 2
+        return (trace < 0) & (det > 0)
+
+    def luminosity(self, area_b, area_w, temp_d):
+        """Luminosity needed for Daisyworld to be at a temperature, planetary_temp solved for lumen
+
+        :param numpy.ndarray area_b: Fraction of surface area for black daisies
+        :param numpy.ndarray area_w: Fraction of surface area for white daisies
+        :param numpy.ndarray temp_d: Average temperature of Daisyworld
+
+        :rtype: numpy.ndarray
+        :return: Solar luminosity
+        """
+        x = simple.uncolonised_ground(area_b, area_w)
+        a_d = simple.planetary_albedo(area_b, area_w, x, a_b=self.a_b, a_w=self.a_w, a_g=self.a_g)
+        return sigma * (temp_d + abs_zero) ** 4 / (self.flux * (1 - a_d))
+
+    def temp_for(self, area_b, area_w, a_y, temp_y):
+        # Planetary temperature that gives a daisy of albedo a_y the local temperature temp_y
+        x = simple.uncolonised_ground(area_b, area_w)
+        a_d = simple.planetary_albedo(area_b, area_w, x, a_b=self.a_b, a_w=self.a_w, a_g=self.a_g)
+        return temp_y - self.q * (a_d - a_y)
+
+
+class Branch:
+    def __init__(self, kind, settings, luminosity, area_b, area_w, temp):
+        self.kind = kind  # "bare", "black", "white" or "both", which daisies are alive
+        self.luminosity = luminosity
+        self.area_b = area_b
+        self.area_w = area_w
+        self.temp = temp  # Average temperature of Daisyworld
+        self.stable = settings.stable(area_b, area_w, luminosity)
+
+    def __len__(self):
+        return len(self.luminosity)
+
+    def folds(self):
+        """Finds where the branch turns back in luminosity, a steady state appears or disappears in pairs there
+
+        :rtype: list
+        :return: Tuples of luminosity, black area, white area and temperature at each fold
+        """
+        turn = np.diff(self.luminosity)
+        folds = []
+        for i in np.nonzero(turn[:-1] * turn[1:] < 0)[0] + 1:
+            # Vertex of the parabola through the three samples around the turning point
+            lum = self.luminosity[i - 1:i + 2]
+            denominator = lum[0] - 2 * lum[1] + lum[2]
+            offset = 0.5 * (lum[0] - lum[2]) / denominator if denominator else 0
+            values = [np.interp(i + offset, [i - 1, i, i + 1], array[i - 1:i + 2])
+                      for array in (self.area_b, self.area_w, self.temp)]
+            lumen = lum[1] - 0.25 * (lum[0] - lum[2]) * offset
+            folds.append((float(lumen), *(float(value) for value in values)))
+        return folds
+
+    def stability_changes(self):
+        """Finds where the branch swaps between stable and unstable without a fold, where it crosses another branch
+
+        :rtype: list
+        :return: Luminosity at each change
+        """
+        changes = np.nonzero(self.stable[:-1] != self.stable[1:])[0]
+        return [float((self.luminosity[i] + self.luminosity[i + 1]) / 2) for i in changes]
+
+
+def branches(settings=None, lumen_range=(0.6, 1.6), samples=2001):
+    """Follows every branch of steady states of the classic Daisyworld
+
+    :param Settings settings: Parameters of the model, defaults to those used in main.simple_main
+    :param tuple lumen_range: Lowest and highest luminosity for bare ground, the other branches go as far as the
+                              daisies can survive
+    :param int samples: Number of points along each branch
+
+    :rtype: list
+    :return: Branch for bare ground, black only, white only and both daisies, when they exist
+    """
+    s = settings or Settings()
+    found = []
+    lumen = np.linspace(lumen_range[0], lumen_range[1], samples)
+    zeros = np.zeros(samples)
+    found.append(Branch("bare", s, lumen, zeros, zeros, simple.planetary_temp(s.flux, lumen, s.a_g)))
+
+    # One daisy on its own, x * beta = gamma gives beta from the area and so two local temperatures, one either
+    # side of the optimum, joined where they meet at the largest area the daisy can cover
+    area = np.linspace(0, 1 - s.gamma, samples)[1:]
+    beta = s.gamma / (1 - area)
+    spread = np.sqrt(np.maximum(1 - beta, 0) / s.c)
+    area = np.concatenate((area, area[-2::-1]))
+    temp_y = s.opt_temp + np.concatenate((-spread, spread[-2::-1]))
+    for kind, a_y in (("black", s.a_b), ("white", s.a_w)):
+        none = np.zeros(len(area))
+        area_b, area_w = (area, none) if kind == "black" else (none, area)
+        temp_d = s.temp_for(area_b, area_w, a_y, temp_y)
+        found.append(Branch(kind, s, s.luminosity(area_b, area_w, temp_d), area_b, area_w, temp_d))
+
+    # Both daisies, they need the same beta so sit either side of the optimum by half the gap the difference in
+    # albedo makes, which fixes beta and so the amount of bare ground
+    half_gap = s.q * (s.a_w - s.a_b) / 2
+    beta = 1 - s.c * half_gap ** 2
+    if s.a_w != s.a_b and beta > s.gamma:
+        x = s.gamma / beta
+        area_b = np.linspace(0, 1 - x, samples)[1:-1]
+        area_w = 1 - x - area_b
+        temp_d = s.temp_for(area_b, area_w, s.a_b, s.opt_temp + half_gap)
+        found.append(Branch("both", s, s.luminosity(area_b, area_w, temp_d), area_b, area_w, temp_d))
+    return found
+
+
+def equilibria(lumen, settings=None, samples=2001):
+    """Every steady state at one luminosity, interpolated between the samples of each branch either side of it
+
+    :param double lumen: Solar luminosity
+    :param Settings settings: Parameters of the model
+    :param int samples: Number of points along each branch
+
+    :rtype: list
+    :return: Tuples of kind, black area, white area, temperature and whether it is stable
+    """
+    s = settings or Settings()
+    found = []
+    for branch in branches(s, samples=samples):
+        if branch.kind == "bare":
+            temp = float(simple.planetary_temp(s.flux, lumen, s.a_g))
+            found.append(("bare", 0.0, 0.0, temp, bool(s.stable(0.0, 0.0, lumen))))
+            continue
+        offset = branch.luminosity - lumen
+        for i in np.nonzero(offset[:-1] * offset[1:] <= 0)[0]:
+            if offset[i] == offset[i + 1]:
+                continue
+            weight = offset[i] / (offset[i] - offset[i + 1])
+            area_b = float(branch.area_b[i] + weight * (branch.area_b[i + 1] - branch.area_b[i]))
+            area_w = float(branch.area_w[i] + weight * (branch.area_w[i + 1] - branch.area_w[i]))
+            temp = float(branch.temp[i] + weight * (branch.temp[i + 1] - branch.temp[i]))
+            found.append((branch.kind, area_b, area_w, temp, bool(s.stable(area_b, area_w, lumen))))
+    return found
+
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : events.py
+Date    : Friday 16 October 2026
+Desc.   : Schedules when each daisy dies and when it becomes old enough to reproduce. Every daisy ages by one each
+          cycle, so both are known the moment it is born. Daisies are dropped into a ring of buckets, one bucket per
+          cycle, and each cycle only the daisies in the bucket that has come round are looked at, instead of checking
+          the age of every daisy on the planet.
+History : 16/10/2026 - v1.0 - Created project file, added EventSchedule
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import numpy as np
+
+_no_cells = np.empty(0, dtype=np.intp)
+
+
+class EventSchedule:
+    def __init__(self, grid, age_of_death, maturity_age):
+        """Starts scheduling every daisy on the grid, along with every daisy put on it from now on
+
+        :param grid.Grid grid: Grid the daisies live on
+        :param int age_of_death: Age a daisy dies at, Point.age_of_death
+        :param int maturity_age: Age a daisy has to be older than to reproduce, Point.maturity_age
+        """
+        self.grid = grid
+        self.age_of_death = age_of_death
+        self.maturity_age = maturity_age
+        # A daisy is never more than age_of_death cycles away from either event, so a ring this long never laps
+        self.slots = age_of_death + 1
+        self.deaths = [[] for i in range(self.slots)]
+        self.maturing = [[] for i in range(self.slots)]
+        self.tick = 0  # Number of cycles scheduled so far
+        self.adults = _no_cells  # Flat index of every daisy old enough to reproduce
+        self._is_adult = np.zeros(grid.x_dim * grid.y_dim, dtype=bool)
+        # The grid adds every newly occupied point to born, they are scheduled at the start of the next cycle
+        grid.born = grid.occupied().tolist()
+
+    def dying(self):
+        """Schedules the daisies born since the last cycle, then finds the daisies that die this cycle
+
+        :rtype: numpy.ndarray
+        :return: Flat indices of the daisies to clear
+        """
+        self._schedule_born()
+        cells = self._due(self.deaths)
+        # A bucket can hold points whose daisy has since died and been replaced, only take the ones that are due
+        cells = cells[self.grid.is_occupied(cells) & (self.grid.age.ravel()[cells] >= self.age_of_death)]
+        if len(cells):
+            self._is_adult[cells] = False
+            self.adults = self.adults[self._is_adult[self.adults]]
+        return cells
+
+    def mature(self):
+        """Ends the cycle, adding the daisies that became old enough to reproduce after ageing
+
+        :rtype: numpy.ndarray
+        :return: Flat indices of every daisy old enough to reproduce
+        """
+        cells = self._due(self.maturing)
+        cells = cells[self.grid.is_occupied(cells) & (self.grid.age.ravel()[cells] > self.maturity_age) &
+                      ~self._is_adult[cells]]
+        if len(cells):
+            self._is_adult[cells] = True
+            self.adults = np.concatenate((self.adults, cells))
+        self.tick += 1
+        return self.adults
+
+    def _schedule_born(self):
+        born = self.grid.born
+        if not born:
+            return
+        self.grid.born = []
+        cells = np.unique(np.array(born, dtype=np.intp))
+        cells = cells[self.grid.is_occupied(cells)]
+        ages = self.grid.age.ravel()[cells]
+        # Dies at the start of the cycle it reaches age_of_death, matures in the cycle its age goes past
+        # maturity_age
+        for ring, wait in ((self.deaths, self.age_of_death - ages), (self.maturing, self.maturity_age - ages)):
+            wait = np.clip(wait, 0, self.slots - 1)
+            for offset in np.unique(wait):
+                ring[(self.tick + offset) % self.slots].append(cells[wait == offset])
+
+    def _due(self, ring):
+        slot = self.tick % self.slots
+        due = ring[slot]
+        if not due:
+            return _no_cells
+        ring[slot] = []
+        return np.unique(np.concatenate(due))
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : genome.py
+Date    : Friday 16 October 2026
+Desc.   : Genes stored as allele codes. Every gene is one of 0.1, 0.2, ..., 1.0, so it is kept as the whole number
+          1 - 10 in a uint8, with 0 meaning there is no daisy. A genome takes 5 bytes instead of 5 floats. Each
+          function works on a whole cohort at once, one genome per row.
+History : 16/10/2026 - v1.0 - Created project file, added allele codes, crossover, mutation and expression
+          16/10/2026 - v1.1 - Colour expressed as a species from a SpeciesTable
+          16/10/2026 - v1.2 - Species picked by a backend
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import numpy as np
+
+import backends
+
+NO_GENE = 0  # Code stored where there is no daisy
+codes = 10  # Number of alleles, gene values go up in steps of 1 / codes
+
+
+def decode(genes):
+    """Turns allele codes into the gene values they stand for
+
+    :param numpy.ndarray genes: Allele codes
+
+    :rtype: numpy.ndarray
+    :return: Gene values, 0 where there is no gene
+    """
+    return genes / codes
+
+
+def encode(values):
+    """Turns gene values into allele codes
+
+    :param values: Gene values between 0.1 - 1
+
+    :rtype: numpy.ndarray
+    :return: Allele codes
+    """
+    return np.rint(np.asarray(values, dtype=float) * codes).astype(np.uint8)
+
+
+def crossover(parent, mate, points):
+    """Point.s_reproduce for a cohort, genes after the crossover point come from the parent and the rest from the mate
+
+    :param numpy.ndarray parent: Genomes of the parents, one per row
+    :param numpy.ndarray mate: Genomes of the mates
+    :param numpy.ndarray points: Crossover point for each child, between 0 - gene length
+
+    :rtype: numpy.ndarray
+    :return: Genomes of the children
+    """
+    from_mate = np.arange(parent.shape[1])[None, :] <= points[:, None]
+    return np.where(from_mate, mate, parent)
+
+
+def mutate(genes, draws, rates, replacements):
+    """Point.mutate_low and mutate_high for a cohort, a gene is replaced when its draw is below the mutation rate
+
+    :param numpy.ndarray genes: Genomes, one per row
+    :param numpy.ndarray draws: Draw between 0 - 1 for every gene
+    :param rates: Mutation rate, for every genome or one for all of them
+    :param numpy.ndarray replacements: Allele code to replace each gene with
+
+    :rtype: numpy.ndarray
+    :return: Mutated genomes
+    """
+    return np.where(draws < np.reshape(rates, (-1, 1)), replacements, genes).astype(np.uint8)
+
+
+def expressed_species(genes, r, table, backend=None):
+    """Point.expressed_colour and pick_one for a cohort, the gene of each species weights the chance of picking it
+
+    :param numpy.ndarray genes: Genomes, one per row
+    :param numpy.ndarray r: Draw between 0 - 1 for each genome that pick_one takes each chance away from
+    :param species.SpeciesTable table: Species to pick between
+    :param backends.PythonBackend backend: Backend to pick with, None for the python backend
+
+    :rtype: numpy.ndarray
+    :return: Index of the species of each genome
+    """
+    values = decode(genes)
+    total = 0
+    for gene in table.genes:
+        total = total + values[:, gene]
+    probabilities = values[:, table.genes] / total[:, None]
+    backend = backends.get("python") if backend is None else backend
+    return table.picked(backend.pick(probabilities, r))
+
+
+def expressed_opt_temp(genes, colours, local_temp):
+    """Point.expressed_opt_temp for a cohort, the allele that puts the optimum closest to the local temperature
+
+    :param numpy.ndarray genes: Genomes, one per row
+    :param numpy.ndarray colours: Albedo of each genome
+    :param numpy.ndarray local_temp: Temperature where each daisy is
+
+    :rtype: numpy.ndarray
+    :return: Optimum temperature of each daisy
+    """
+    values = decode(genes)
+    allele_a = local_temp * (colours + values[:, 3])
+    allele_b = local_temp * (colours + values[:, 4])
+    return np.where(np.abs(local_temp - allele_b) > np.abs(local_temp - allele_a), allele_a, allele_b)
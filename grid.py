@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : grid.py
+Date    : Friday 16 October 2026
+Desc.   : Structure-of-arrays storage for the state of every point on Daisyworld. Each attribute that used to live on
+          a Point object is now one NumPy array indexed by [x, y], Point is only a view onto a cell of these arrays.
+History : 16/10/2026 - v1.0 - Created project file, moved point state into arrays
+          16/10/2026 - v1.1 - Keeps a list of occupied points up to date so daisies can be visited without scanning
+                              the whole grid
+          16/10/2026 - v1.2 - Newly occupied points can be collected for an EventSchedule
+          16/10/2026 - v1.3 - Holds the shared neighbour and dispersal tables for its size
+          16/10/2026 - v1.4 - Added place to colour many bare points at once
+          16/10/2026 - v1.5 - Genes held as uint8 allele codes
+          16/10/2026 - v1.6 - Age held as int16, added nbytes to check the memory used per point
+          16/10/2026 - v1.7 - Each point stores the index of its species
+          16/10/2026 - v1.8 - Holds the backend the kernels of reproduction run on
+          16/10/2026 - v1.9 - Random numbers from a RandomStream
+          16/10/2026 - v1.10 - Tells a StatsTracker about every birth and death
+          16/10/2026 - v1.11 - List of occupied points never grows past the number of points
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import numpy as np
+
+import backends
+import neighbourhood
+import species as daisy_species
+from genome import NO_GENE
+from species import NO_SPECIES
+from streams import RandomStream
+
+# Value stored in the age array where there is no daisy, stands in for None
+NO_AGE = -1
+
+
+class Grid:
+    def __init__(self, x_dim, y_dim, gene_length=5, ground=0.5, rng=None, species=None, backend=None):
+        self.x_dim = x_dim
+        self.y_dim = y_dim
+        self.gene_length = gene_length
+        self.ground = ground
+        # Source of randomness for everything living on this grid
+        self.random = RandomStream() if rng is None else rng
+        self.species_table = daisy_species.with_grey if species is None else species
+        self.backend = backends.get("python") if backend is None else backend  # See backends.py
+
+        shape = (x_dim, y_dim)
+        self.colour = np.full(shape, ground)  # Albedo of each point, ground albedo when empty
+        self.local_temp = np.full(shape, np.nan)
+        self.age = np.full(shape, NO_AGE, dtype=np.int16)  # Never goes past Point.age_of_death
+        self.nutrients = np.full(shape, np.nan)
+        self.opt_temp = np.full(shape, np.nan)
+        self.genes = np.full(shape + (gene_length,), NO_GENE, dtype=np.uint8)  # Allele codes, see genome.py
+        self.species = np.full(shape, NO_SPECIES, dtype=np.int8)  # Index into species_table
+
+        # Flat index of every point with a daisy on it, in no particular order, and where each point sits in that
+        # list, -1 for bare ground. Kept up to date by set_colour and clear
+        self._active = np.empty(min(64, x_dim * y_dim), dtype=np.intp)
+        self._slot = np.full(x_dim * y_dim, -1, dtype=np.intp)
+        self.count = 0
+        # Shared by every grid of the same size
+        self.neighbours = neighbourhood.table(neighbourhood.neighbour_deltas, x_dim, y_dim)
+        self.dispersal = neighbourhood.table(neighbourhood.dispersal_deltas, x_dim, y_dim)
+        self.born = None  # List of newly occupied points, only collected once an EventSchedule sets it to a list
+        self.stats = None  # StatsTracker told about every change, set by the tracker
+
+    @property
+    def shape(self):
+        return self.x_dim, self.y_dim
+
+    def empty(self):
+        """Finds every point without a daisy on it, same check as Point.check_pos
+
+        :rtype: numpy.ndarray
+        :return: Boolean array, True where the point is bare ground
+        """
+        return self.colour == self.ground
+
+    def occupied(self):
+        """Finds every point with a daisy on it without scanning the grid
+
+        :rtype: numpy.ndarray
+        :return: Flat indices of the points, in no particular order
+        """
+        return self._active[:self.count]
+
+    def nbytes(self):
+        """Memory held by the state of every point, the shared neighbourhood tables are not counted. Comes to 48
+        bytes a point on a bare grid, plus 512 for the first slots of the occupied list, and at most 56 a point once
+        every point is occupied, as the occupied list stops growing at one slot a point. A 1000x1000 grid stays under
+        56 MB
+
+        :rtype: int
+        :return: Number of bytes
+        """
+        arrays = (self.colour, self.local_temp, self.age, self.nutrients, self.opt_temp, self.genes, self.species,
+                  self._active, self._slot)
+        return sum(array.nbytes for array in arrays)
+
+    def is_occupied(self, cells):
+        """Checks which points have a daisy on them
+
+        :param numpy.ndarray cells: Flat indices of the points
+
+        :rtype: numpy.ndarray
+        :return: True for each point with a daisy
+        """
+        return self._slot[cells] >= 0
+
+    def set_colour(self, cell, value):
+        """Sets the albedo of one point, adding it to or removing it from the occupied points
+
+        :param tuple cell: Coordinates of the point
+        :param double value: Albedo, ground albedo for no daisy
+        """
+        if self.stats is not None:
+            self.stats.colour_changed(cell, float(self.colour[cell]), value)
+        self.colour[cell] = value
+        index = cell[0] * self.y_dim + cell[1]
+        if value != self.ground:
+            if self._slot[index] < 0:
+                if self.count == len(self._active):
+                    self._grow_active(self.count + 1)
+                self._active[self.count] = index
+                self._slot[index] = self.count
+                self.count += 1
+                if self.born is not None:
+                    self.born.append(index)
+        elif self._slot[index] >= 0:
+            # Swap the last occupied point into the gap
+            slot = self._slot[index]
+            last = self._active[self.count - 1]
+            self._active[slot] = last
+            self._slot[last] = slot
+            self._slot[index] = -1
+            self.count -= 1
+
+    def set_species(self, cell, value):
+        """Sets the species of one point
+
+        :param tuple cell: Coordinates of the point
+        :param int value: Index of the species, NO_SPECIES for none
+        """
+        if self.stats is not None:
+            self.stats.species_changed(cell, int(self.species[cell]), value)
+        self.species[cell] = value
+
+    def place(self, cells, species):
+        """Puts daisies on many bare points at once, adding the ones that now have a daisy to the occupied points
+
+        :param numpy.ndarray cells: Flat indices of the points, each one bare and none repeated
+        :param numpy.ndarray species: Index of the species for each point, NO_SPECIES for the albedo of bare ground
+        """
+        colours = self.species_table.albedo[species]
+        if self.stats is not None:
+            self.stats.changed(cells, self.species.ravel()[cells], species, self.colour.ravel()[cells], colours)
+        self.species.ravel()[cells] = species
+        self.colour.ravel()[cells] = colours
+        added = cells[colours != self.ground]
+        if self.count + len(added) > len(self._active):
+            self._grow_active(self.count + len(added))
+        self._active[self.count:self.count + len(added)] = added
+        self._slot[added] = np.arange(self.count, self.count + len(added))
+        self.count += len(added)
+        if self.born is not None:
+            self.born.extend(added.tolist())
+
+    def clear(self, cells):
+        """Turns every point in cells back into bare ground
+
+        :param numpy.ndarray cells: Flat indices of the points to clear, each one occupied
+        """
+        if self.stats is not None:
+            self.stats.changed(cells, self.species.ravel()[cells], NO_SPECIES, self.colour.ravel()[cells], self.ground)
+        # Every array is allocated here so is contiguous and ravel gives a view
+        self.colour.ravel()[cells] = self.ground
+        self.age.ravel()[cells] = NO_AGE
+        self.nutrients.ravel()[cells] = np.nan
+        self.genes.reshape(-1, self.gene_length)[cells] = NO_GENE
+        self.species.ravel()[cells] = NO_SPECIES
+
+        self._slot[cells] = -1
+        active = self.occupied()
+        remaining = active[self._slot[active] >= 0]
+        self.count = len(remaining)
+        self._active[:self.count] = remaining
+        self._slot[remaining] = np.arange(self.count)
+
+    def _grow_active(self, needed):
+        # Doubles the list of occupied points, never past one entry for every point on the grid
+        grown = np.empty(min(max(2 * len(self._active), needed), self.x_dim * self.y_dim), dtype=np.intp)
+        grown[:self.count] = self.occupied()
+        self._active = grown
+
+    def rebuild_occupied(self):
+        """Works out the occupied points again from colour, needed after writing to colour directly"""
+        self._active = np.flatnonzero(self.colour != self.ground).astype(np.intp)
+        self.count = len(self._active)
+        self._slot[:] = -1
+        self._slot[self._active] = np.arange(self.count)
+        if self.born is not None:
+            self.born.extend(self._active.tolist())
+        if self.stats is not None:
+            self.stats.rebuild()
+        if self.count == 0:
+            self._active = np.empty(min(64, self.x_dim * self.y_dim), dtype=np.intp)
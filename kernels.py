@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : kernels.py
+Date    : Friday 16 October 2026
+Desc.   : Whole-grid versions of the per-point equations in point.py, each function works on NumPy arrays holding
+          every point on Daisyworld at once.
+History : 16/10/2026 - v1.0 - Created project file, added vectorised growth rate
+          16/10/2026 - v1.1 - Added whole-grid temperature and diffusion
+          16/10/2026 - v1.2 - Neighbour counts taken from the shared neighbour table
+          16/10/2026 - v1.3 - Solar factor scaled to the height of the grid
+          16/10/2026 - v1.4 - Neighbour counts for a band of rows
+          16/10/2026 - v1.5 - Added radiative_temp and diffusion_weights for the statistics tracker
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import numpy as np
+
+import neighbourhood
+
+sigma = 5.67037e-8  # Stefan-Boltzmann constant
+abs_zero = 273.15  # Used to calculate temperature in celsius
+
+
+def beta_y(opt_temp, temp_y, c=0.003265):
+    """Daisy growth rate function for every point, same curve as Point.beta_y
+
+    :param numpy.ndarray opt_temp: Optimum temperature of each daisy
+    :param numpy.ndarray temp_y: Local temperature experienced by each daisy
+    :param double c: Determines quadratic width, allowing growth to range from 5 to 40 degrees celsius on a negative parabolic curve
+
+    :rtype: numpy.ndarray
+    :return: Values between 0 - 1, 0 indicating no growth, 1 indicating maximal growth
+    """
+    width = np.sqrt(1 / c)
+    min_growth = np.round(opt_temp - width, 1)
+    max_growth = np.round(opt_temp + width, 1)
+    in_range = (min_growth <= temp_y) & (temp_y <= max_growth)
+    return np.where(in_range, 1 - c * (opt_temp - temp_y) ** 2, 0.0)
+
+
+def solar_factor(y_coords, y_dim=50):
+    """Generates number between 0.8 - 1.2 based on y-coordinate between North and South pole, same as
+    Point.solar_factor
+
+    :param numpy.ndarray y_coords: Y-coordinates on map
+    :param int y_dim: Height of the map, the equator is halfway up and the poles at either edge
+
+    :rtype: numpy.ndarray
+    :return: Multiplier for each y-coordinate
+    """
+    equator = y_dim / 2
+    # 0.00064 took the 50 high planet from 1.2 at the equator to 0.8 at the poles, scaled to keep that on any height
+    curve = 0.00064 * (25 / equator) ** 2
+    return np.round(1.2 - curve * (np.asarray(y_coords) - equator) ** 2, 2)
+
+
+def local_temp(colour, solar, a_d, lumen, flux=1050, q=20):
+    """Works out temperature at every point, same as Point.calc_temp
+
+    :param numpy.ndarray colour: Albedo of each point
+    :param numpy.ndarray solar: Solar factor of each point, anything that broadcasts against colour
+    :param double a_d: Planetary albedo
+    :param double lumen: Solar luminosity
+    :param double flux: Solar flux constant
+    :param int q: Heat absorption coefficient
+
+    :rtype: numpy.ndarray
+    :return: Temperature of each point
+    """
+    return q * (a_d - colour) + radiative_temp(solar, a_d, lumen, flux)
+
+
+def radiative_temp(solar, a_d, lumen, flux=1050):
+    """Temperature the planet would have at a latitude before the albedo of a point is taken into account
+
+    :param numpy.ndarray solar: Solar factor
+    :param double a_d: Planetary albedo
+    :param double lumen: Solar luminosity
+    :param double flux: Solar flux constant
+
+    :rtype: numpy.ndarray
+    :return: Temperature for each solar factor
+    """
+    return ((solar * (flux * lumen * (1 - a_d) / sigma)) ** 0.25) - abs_zero
+
+
+def neighbour_counts(shape, rows=slice(None)):
+    """Counts how many points are averaged for each point when diffusing, the point itself and all of its
+    neighbours that are on the grid
+
+    :param tuple shape: Dimensions of the grid
+    :param slice rows: Range of y-coordinates to count for, defaults to the whole grid
+
+    :rtype: numpy.ndarray
+    :return: Between 4 in a corner and 9 in the middle of the grid
+    """
+    return 1.0 + neighbourhood.table(neighbourhood.neighbour_deltas, *shape).counts(rows)
+
+
+def diffuse(temps, counts=None):
+    """Smooths temperature by averaging each point with its 8 neighbours, same as Daisyworld.find_diffuse_temp.
+    Points off the edge of the grid are not counted, matching Point.is_valid_point
+
+    :param numpy.ndarray temps: Temperature of each point
+    :param numpy.ndarray counts: Output of neighbour_counts for this grid, worked out if not given
+
+    :rtype: numpy.ndarray
+    :return: Smoothed temperature of each point
+    """
+    if counts is None:
+        counts = neighbour_counts(temps.shape)
+    return _window_sum(temps) / counts
+
+
+def diffusion_weights(dim):
+    """How much each point along one side of the grid counts towards the diffused temperature of the whole grid.
+    The neighbours averaged over split into the ones along x and the ones along y, so the weight of a point on the
+    grid is its weight along x times its weight along y, and sum(diffuse(temps)) == sum(weights * temps)
+
+    :param int dim: Length of the side
+
+    :rtype: numpy.ndarray
+    :return: Weight of each coordinate, 1 away from the edges
+    """
+    # Points along the side each point is averaged with, itself included
+    window = np.ones(dim)
+    window[1:] += 1
+    window[:-1] += 1
+    # Each point counts 1 / window towards every point it is averaged into
+    share = 1 / window
+    weights = share.copy()
+    weights[1:] += share[:-1]
+    weights[:-1] += share[1:]
+    return weights
+
+
+def _window_sum(values):
+    # Sum over each 3x3 window, padding with zeros so the edges only count points on the grid
+    padded = np.pad(values, 1)
+    x_dim, y_dim = values.shape
+    total = np.zeros(values.shape)
+    for dx in range(3):
+        for dy in range(3):
+            total += padded[dx:dx + x_dim, dy:dy + y_dim]
+    return total
@@ -6,18 +6,48 @@ File    : main.py
 Date    : Thursday 26 November 2020
 Desc.   : Stores the constants used for daisyworld.py
 History : 26/11/2020 - v1.0 - Created project file, added initial constants
+          16/10/2026 - v1.1 - Runs split from their plots and looked up in a ResultCache when one is given
 
 """
-import math
 import matplotlib.pyplot as plt
 import numpy as np
 
 import simple_daisyworld as simple
+import equilibrium
 import daisyworld as enhanced
-import dw_without_grey as enhanced_without_grey
-
-
-def simple_main(albedo_b, albedo_w, death_type="default", growth_rate="default"):
+import plotting
+import species
+from point import Point
+from results import RunResult
+
+# Settings of Point that change what an enhanced run gives, part of the key of a cached run
+point_settings = ("age_of_death", "maturity_age", "req_resource", "sexual_cost", "clonal_cost", "mate_range",
+                  "mutation_rate_low", "mutation_rate_high", "gene_length", "ground", "flux")
+
+
+def simple_run(albedo_b, albedo_w, death_type="default", growth_rate="default", method="euler", sim_length=550,
+               cache=None):
+    """Runs the classic Daisyworld over a rise in luminosity
+
+    :param double albedo_b: Albedo of black daisies
+    :param double albedo_w: Albedo of white daisies
+    :param str death_type: "default" or "plague"
+    :param str growth_rate: "default", "high" or "low"
+    :param str method: "euler" or "adaptive"
+    :param int sim_length: Number of luminosity steps
+    :param result_cache.ResultCache cache: Cache to look the run up in, None to always run it
+
+    :rtype: dict
+    :return: Arrays of luminosity, temperature without and with daisies and coverage of black and white daisies
+    """
+    params = {"albedo_b": albedo_b, "albedo_w": albedo_w, "death_type": death_type, "growth_rate": growth_rate,
+              "method": method, "sim_length": sim_length}
+    if cache is None:
+        return _simple_run(**params)
+    return cache.fetch("simple", params, lambda: _simple_run(**params))
+
+
+def _simple_run(albedo_b, albedo_w, death_type, growth_rate, method, sim_length):
     a_b = albedo_b
     a_w = albedo_w
     a_g = 0.5
@@ -27,14 +57,8 @@ def simple_main(albedo_b, albedo_w, death_type="default", growth_rate="default")
     flux = 1050  # Rate of energy received in Watts per metre**2. Note: Value used is smaller than observed constant to simulate a younger star.
     # q = 20  # Heat absorption coefficient
     resolution = 10000
-    if growth_rate is "high":
-        c = 0.002
-    elif growth_rate is "low":
-        c = 0.013265
-    elif growth_rate == "default":
-        c = 0.003265
-
-    sim_length = 550
+    c = simple.growth_rates[growth_rate]
+
     overtime_sun_intensity = []
     planet_temp = []
     planet_temp_d = []
@@ -47,36 +71,53 @@ def simple_main(albedo_b, albedo_w, death_type="default", growth_rate="default")
             area_b = 0.01
         if area_w < 0.01:
             area_w = 0.01
-        if death_type is "plague":
-            gamma = -0.15 * math.cos(step) + 0.45
-        elif death_type is "default":
-            gamma = 0.3  # Death rate of both daisies
+        gamma = simple.death_rate(step, death_type)  # Death rate of both daisies
         x = simple.uncolonised_ground(area_b, area_w)  # Fractional area covered by bare ground, x = p - a_b - a_w
         lumen = simple.solar_luminosity(step, sim_length)
         temp = simple.planetary_temp(flux, lumen, a_g)
-        i = 0
-        while i < resolution:
-            a_d = simple.planetary_albedo(area_b, area_w, x, a_b=a_b, a_w=a_w, a_g=a_g)
-            temp_d = simple.planetary_temp(flux, lumen, a_d)
-
-            loc_temp_b = simple.local_temp(a_b, a_d, temp_d)
-            beta_b = simple.beta_y(loc_temp_b, c=c)
-            loc_temp_w = simple.local_temp(a_w, a_d, temp_d)
-            beta_w = simple.beta_y(loc_temp_w, c=c)
-
-            darea_bdt = simple.daisy_growth(area_b, x, beta_b, gamma)
-            area_b = area_b + darea_bdt
-            darea_wdt = simple.daisy_growth(area_w, x, beta_w, gamma)
-            area_w = area_w + darea_wdt
-
-            x = simple.uncolonised_ground(area_b, area_w)
-            i += 1
+        if method == "adaptive":
+            # Carries on from the equilibrium of the last luminosity and stops as soon as it reaches the next one
+            area_b, area_w, temp_d, _ = simple.integrate_adaptive(area_b, area_w, lumen, gamma, a_b=a_b, a_w=a_w,
+                                                                  a_g=a_g, flux=flux, c=c, horizon=resolution)
+        elif method == "euler":
+            i = 0
+            while i < resolution:
+                a_d = simple.planetary_albedo(area_b, area_w, x, a_b=a_b, a_w=a_w, a_g=a_g)
+                temp_d = simple.planetary_temp(flux, lumen, a_d)
+
+                loc_temp_b = simple.local_temp(a_b, a_d, temp_d)
+                beta_b = simple.beta_y(loc_temp_b, c=c)
+                loc_temp_w = simple.local_temp(a_w, a_d, temp_d)
+                beta_w = simple.beta_y(loc_temp_w, c=c)
+
+                darea_bdt = simple.daisy_growth(area_b, x, beta_b, gamma)
+                area_b = area_b + darea_bdt
+                darea_wdt = simple.daisy_growth(area_w, x, beta_w, gamma)
+                area_w = area_w + darea_wdt
+
+                x = simple.uncolonised_ground(area_b, area_w)
+                i += 1
+        else:
+            raise ValueError("Unknown method: " + str(method))
         planet_temp_d.append(temp_d)
         planet_temp.append(temp)
         overtime_sun_intensity.append(lumen)
         b_coverage.append(area_b * 100)
         w_coverage.append(area_w * 100)
 
+    return {"luminosity": np.array(overtime_sun_intensity), "planet_temp": np.array(planet_temp),
+            "planet_temp_d": np.array(planet_temp_d), "b_coverage": np.array(b_coverage),
+            "w_coverage": np.array(w_coverage)}
+
+
+def simple_main(albedo_b, albedo_w, death_type="default", growth_rate="default", method="euler", cache=None):
+    run = simple_run(albedo_b, albedo_w, death_type, growth_rate, method, cache=cache)
+    overtime_sun_intensity = run["luminosity"]
+    planet_temp = run["planet_temp"]
+    planet_temp_d = run["planet_temp_d"]
+    b_coverage = run["b_coverage"]
+    w_coverage = run["w_coverage"]
+
     plt.plot(overtime_sun_intensity, planet_temp_d, 'b', label='With daisies')
     plt.plot(overtime_sun_intensity, planet_temp, 'r', label='Without daisies')
     plt.legend(loc='upper right')
@@ -94,7 +135,54 @@ def simple_main(albedo_b, albedo_w, death_type="default", growth_rate="default")
     plt.show()
 
 
-def enhanced_main():
+def equilibrium_main(albedo_b, albedo_w, growth_rate="default"):
+    settings = equilibrium.Settings(a_b=albedo_b, a_w=albedo_w, c=simple.growth_rates[growth_rate])
+    colours = {"bare": 'r', "black": 'k', "white": 'g', "both": 'b'}
+    for branch in equilibrium.branches(settings):
+        # Stable steady states drawn solid, unstable ones dashed
+        for stable, style in ((True, '-'), (False, '--')):
+            temp = np.where(branch.stable == stable, branch.temp, np.nan)
+            plt.plot(branch.luminosity, temp, colours[branch.kind] + style,
+                     label=branch.kind.capitalize() if stable else None)
+        for fold in branch.folds():
+            plt.plot(fold[0], fold[3], colours[branch.kind] + 'o')
+    plt.legend(loc='upper left')
+    plt.title('Steady state temperature over luminosity')
+    plt.xlabel('Solar Luminosity')
+    plt.ylabel('Temperature (°C)')
+    plt.show()
+
+
+def enhanced_run(x_dim, y_dim, luminosities, init_pop, seed=None, species_table=None, cache=None):
+    """Runs the enhanced Daisyworld through a luminosity schedule
+
+    :param int x_dim: Width of the grid
+    :param int y_dim: Height of the grid
+    :param luminosities: Luminosity schedule
+    :param int init_pop: Number of daisies to start with
+    :param int seed: Seed of the world's random number generator
+    :param species.SpeciesTable species_table: Kinds of daisy that grow, None for black, white and grey
+    :param result_cache.ResultCache cache: Cache to look the run up in, None to always run it
+
+    :rtype: RunResult
+    :return: Results of Daisyworld.run
+    """
+    def run():
+        world = enhanced.Daisyworld(x_dim, y_dim, luminosities, init_pop, seed=seed, species=species_table)
+        return world.run().as_dict()
+
+    # A world without a seed grows different daisies every time it is run, so there is nothing to look up
+    if cache is None or seed is None:
+        return RunResult.from_dict(run())
+    table = species.with_grey if species_table is None else species_table
+    params = {"x_dim": x_dim, "y_dim": y_dim, "luminosities": np.asarray(luminosities, dtype=float),
+              "init_pop": init_pop, "seed": seed, "species": table.species, "ground": table.ground,
+              "unpicked": table.unpicked, "point": {name: getattr(Point, name) for name in point_settings},
+              "cycles_per_lumen": enhanced.Daisyworld.cycles_per_lumen}
+    return RunResult.from_dict(cache.fetch("enhanced", params, run))
+
+
+def enhanced_main(seed=None, cache=None):
     x_dim = 50
     y_dim = 50
     # Do not recommend using this list,
@@ -103,16 +191,15 @@ def enhanced_main():
                     0.72, 0.73, 0.74, 0.75, 0.74, 0.73, 0.72, 0.71, 0.70, 0.71, 0.72, 0.73, 0.74, 0.75, 0.76, 0.77,
                     0.78, 0.79, 0.80]
     luminosities1 = np.arange(0.6, 1.4, 0.005)
-    world = enhanced.Daisyworld(x_dim, y_dim, luminosities1, 350)
-    world.run()
+    plotting.plot_run(enhanced_run(x_dim, y_dim, luminosities1, 350, seed=seed, cache=cache))
 
 
-def enhanced_wout_grey_main():
+def enhanced_wout_grey_main(seed=None, cache=None):
     x_dim = 50
     y_dim = 50
     luminosities1 = np.arange(0.6, 1.4, 0.005)
-    world = enhanced_without_grey.Daisyworld(x_dim, y_dim, luminosities1, 350)
-    world.run()
+    plotting.plot_run(enhanced_run(x_dim, y_dim, luminosities1, 350, seed=seed, species_table=species.without_grey,
+                                   cache=cache), show_red=False)
 
 
 if __name__ == "__main__":
@@ -121,5 +208,6 @@ if __name__ == "__main__":
     # simple_main(0.25, 0.75, death_type="plague")
     # simple_main(0.25, 0.75, growth_rate="high")
     # simple_main(0.25, 0.75, growth_rate="low")
+    # equilibrium_main(0.25, 0.75)
     enhanced_main()
     # enhanced_wout_grey_main()
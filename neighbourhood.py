@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : neighbourhood.py
+Date    : Friday 16 October 2026
+Desc.   : Precomputed tables of the points around a point, for the 8 neighbours used when diffusing temperature and
+          the diamond of 60 points a child daisy can land on. Which offsets stay on the grid only depends on how close
+          a point is to each edge, so a grid only has a handful of different neighbourhoods. Each one is worked out
+          once as a list of flat index offsets, stored CSR style, and shared by every point with the same distances
+          to the edges.
+History : 16/10/2026 - v1.0 - Created project file, added OffsetTable
+          16/10/2026 - v1.1 - Added choose to pick a random point around many points at once
+          16/10/2026 - v1.2 - Counts can be worked out for a band of rows
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+from functools import lru_cache
+
+import numpy as np
+
+# The 8 points touching a point
+neighbour_deltas = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+# Every point within 5 steps of a point, not counting the point itself, in the order Point.possible_points always
+# listed them so random choices land on the same points
+dispersal_deltas = ((0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (2, 0), (2, 1),
+                    (2, 2), (2, 3), (3, 0), (3, 1), (3, 2), (4, 0), (4, 1), (5, 0), (-1, 0), (-1, 1), (-1, 2), (-1, 3),
+                    (-1, 4), (-2, 0), (-2, 1), (-2, 2), (-2, 3), (-3, 0), (-3, 1), (-3, 2), (-4, 0), (-4, 1), (-5, 0),
+                    (0, -1), (1, -1), (2, -1), (3, -1), (4, -1), (0, -2), (1, -2), (2, -2), (3, -2), (0, -3), (1, -3),
+                    (2, -3), (0, -4), (1, -4), (0, -5), (-1, -1), (-2, -1), (-3, -1), (-4, -1), (-1, -2), (-2, -2),
+                    (-3, -2), (-1, -3), (-2, -3), (-1, -4))
+
+
+class OffsetTable:
+    def __init__(self, deltas, x_dim, y_dim):
+        """Works out the offsets that stay on the grid for every distinct neighbourhood
+
+        :param tuple deltas: Change in x and y to each point in the neighbourhood
+        :param int x_dim: Width of the grid
+        :param int y_dim: Height of the grid
+        """
+        self.x_dim = x_dim
+        self.y_dim = y_dim
+        self.deltas = deltas
+        reach = max(max(abs(dx), abs(dy)) for dx, dy in deltas)
+        # Points closer to an edge than reach lose some offsets, further in they all have the full set
+        self.x_class, x_examples = _edge_classes(x_dim, reach)
+        self.y_class, y_examples = _edge_classes(y_dim, reach)
+        self.y_classes = len(y_examples)
+
+        indptr = [0]
+        offsets = []
+        for x in x_examples:
+            for y in y_examples:
+                offsets += [dx * y_dim + dy for dx, dy in deltas if 0 <= x + dx < x_dim and 0 <= y + dy < y_dim]
+                indptr.append(len(offsets))
+        self.indptr = np.array(indptr, dtype=np.intp)
+        self.offsets = np.array(offsets, dtype=np.intp)
+
+    def __call__(self, cell):
+        """Every point in the neighbourhood of a point that is on the grid
+
+        :param int cell: Flat index of the point
+
+        :rtype: numpy.ndarray
+        :return: Flat indices of the points, in the order of deltas
+        """
+        x, y = divmod(cell, self.y_dim)
+        group = self.x_class[x] * self.y_classes + self.y_class[y]
+        return cell + self.offsets[self.indptr[group]:self.indptr[group + 1]]
+
+    def coords(self, x, y):
+        """Same as calling the table, with coordinates in and out
+
+        :param int x: X coordinate of the point
+        :param int y: Y coordinate of the point
+
+        :rtype: list
+        :return: Coordinates of the points in the neighbourhood
+        """
+        cells = self(x * self.y_dim + y)
+        return list(zip((cells // self.y_dim).tolist(), (cells % self.y_dim).tolist()))
+
+    def choose(self, cells, r):
+        """Picks one point in the neighbourhood of each of many points, like random.choice on each of them
+
+        :param numpy.ndarray cells: Flat index of each point
+        :param numpy.ndarray r: Random draw between 0 - 1 for each point
+
+        :rtype: numpy.ndarray
+        :return: Flat index of the point picked for each, -1 where the neighbourhood is empty
+        """
+        group = self.x_class[cells // self.y_dim] * self.y_classes + self.y_class[cells % self.y_dim]
+        start = self.indptr[group]
+        size = self.indptr[group + 1] - start
+        picked = np.minimum(start + (r * size).astype(np.intp), len(self.offsets) - 1)
+        return np.where(size > 0, cells + self.offsets[picked] if len(self.offsets) else -1, -1)
+
+    def counts(self, rows=slice(None)):
+        """Number of points in the neighbourhood of every point on the grid
+
+        :param slice rows: Range of y-coordinates to count for, defaults to the whole grid
+
+        :rtype: numpy.ndarray
+        :return: Count for each point, shape (x_dim, y_dim) for the whole grid
+        """
+        sizes = np.diff(self.indptr)
+        return sizes[self.x_class[:, None] * self.y_classes + self.y_class[None, rows]]
+
+
+@lru_cache(maxsize=None)
+def table(deltas, x_dim, y_dim):
+    """Table for a neighbourhood on a grid size, made once and shared by every world of that size
+
+    :param tuple deltas: Change in x and y to each point in the neighbourhood
+    :param int x_dim: Width of the grid
+    :param int y_dim: Height of the grid
+
+    :rtype: OffsetTable
+    :return: Table of the neighbourhood
+    """
+    return OffsetTable(deltas, x_dim, y_dim)
+
+
+def _edge_classes(dim, reach):
+    # Groups coordinates by how far they are from each edge, capped at reach, and picks one example of each group
+    key = np.minimum(np.arange(dim), reach) * (reach + 1) + np.minimum(np.arange(dim)[::-1], reach)
+    keys, examples, classes = np.unique(key, return_index=True, return_inverse=True)
+    return classes.astype(np.intp), examples.tolist()
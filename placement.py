@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : placement.py
+Date    : Friday 16 October 2026
+Desc.   : Places every child of a generation at once. Daisyworld.reproduce pairs the mature daisies up as before,
+          then the number of children, where they land, their genes, colour, optimum temperature and nutrients are
+          all drawn as arrays and written to the grid together. Children land in the order their parents took turns,
+          a child landing on a point that already had a daisy, or that an earlier child took, dies from overcrowding
+          just like it does when children are placed one at a time.
+History : 16/10/2026 - v1.0 - Created project file, added place_offspring
+          16/10/2026 - v1.1 - Genetics done on allele codes through genome.py
+          16/10/2026 - v1.2 - Species, litter sizes and counts taken from the grid's SpeciesTable
+          16/10/2026 - v1.3 - Species picking and overcrowding done by the grid's backend
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import numpy as np
+
+import genome
+from point import Point
+
+
+def place_offspring(grid, parents, mates, rng):
+    """Has every pair, or single daisy without a mate, produce the number of children its species has
+
+    :param grid.Grid grid: Grid the daisies live on
+    :param numpy.ndarray parents: Flat index of each daisy that took a turn, in the order they took it
+    :param numpy.ndarray mates: Flat index of the mate each daisy picked, -1 for clonal reproduction
+    :param numpy.random.Generator rng: Source of every random draw
+
+    :rtype: numpy.ndarray
+    :return: Number of daisies of each species placed
+    """
+    gene_length = grid.gene_length
+    table = grid.species_table
+    sexual = mates >= 0
+    nutrients = grid.nutrients.ravel()
+    nutrients[parents[~sexual]] -= Point.clonal_cost
+    nutrients[parents[sexual]] -= Point.sexual_cost
+    nutrients[mates[sexual]] -= Point.sexual_cost
+
+    # Children land around the parent, or around the point between both parents. y_mid is worked out from the first
+    # parent twice, as it always has been
+    # Litter sizes come from the range of the species of the daisy taking its turn
+    offspring = np.array(table.offspring, dtype=np.int64).reshape(-1, 2)[grid.species.ravel()[parents]]
+    litter = rng.integers(offspring[:, 0], offspring[:, 1] + 1)
+    owner = np.repeat(np.arange(len(parents)), litter)  # Which turn each child came from
+    mates = np.where(sexual, mates, parents)
+    x_mid = (parents // grid.y_dim + mates // grid.y_dim) // 2
+    centre = np.where(sexual, x_mid * grid.y_dim + parents % grid.y_dim, parents)[owner]
+    targets = grid.dispersal.choose(centre, rng.random(len(owner)))
+    born = len(owner)
+
+    # Sexual children take the genes of the mate up to the crossover and the rest from the parent, clones copy the
+    # parent. Colour and optimum temperature are expressed before mutating, like grow_daisy then mutate
+    genes = grid.genes.reshape(-1, gene_length)
+    is_sexual = sexual[owner]
+    # Clones have themselves as their mate, so crossing over leaves their parent's genes as they are
+    crossover = rng.integers(0, gene_length + 1, size=born)
+    child_genes = genome.crossover(genes[parents[owner]], genes[mates[owner]], crossover)
+    kinds = genome.expressed_species(child_genes, rng.integers(0, 11, size=born) / 10, table, grid.backend)
+    colours = table.albedo[kinds]
+    local_temp = grid.local_temp.ravel()[np.maximum(targets, 0)]
+    opt_temp = genome.expressed_opt_temp(child_genes, colours, local_temp)
+    child_nutrients = rng.integers(2, 6, size=born)
+    # Clones mutate at the high rate from a draw of 1 - 10, the others at the low rate from a draw of 0 - 10
+    draws = rng.integers(np.where(is_sexual, 0, 1)[:, None], 11, size=(born, gene_length)) / 10
+    rates = np.where(is_sexual, Point.mutation_rate_low, Point.mutation_rate_high)
+    child_genes = genome.mutate(child_genes, draws, rates, rng.integers(1, genome.codes + 1, size=(born, gene_length)))
+
+    # Only points that were bare at the start can be landed on. A red daisy has the albedo of bare ground so the
+    # next child along lands on top of it, the first other colour to land on a point keeps it
+    claims = np.flatnonzero((targets >= 0) & (grid.colour.ravel()[np.maximum(targets, 0)] == grid.ground))
+    claims = claims[np.argsort(targets[claims], kind="stable")]
+    cells = targets[claims]
+    landed, last = grid.backend.settle(cells, colours[claims] != grid.ground)
+
+    # Daisies of no species are counted in the extra bin on the end and dropped
+    landed_kinds = kinds[claims[landed]]
+    counts = np.bincount(landed_kinds % (len(table) + 1), minlength=len(table) + 1)[:len(table)]
+    Point.total_daisies += len(landed_kinds)
+    Point.alive_daisies += len(landed_kinds)
+
+    children = claims[last]
+    cells = cells[last]
+    genes[cells] = child_genes[children]
+    grid.opt_temp.ravel()[cells] = opt_temp[children]
+    grid.age.ravel()[cells] = 0
+    nutrients[cells] = child_nutrients[children]
+    grid.place(cells, kinds[children])
+    return counts
+
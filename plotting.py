@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : plotting.py
+Date    : Friday 16 October 2026
+Desc.   : Graphs of the results of the enhanced Daisyworld, kept apart from the model so runs without a display never
+          need matplotlib.
+History : 16/10/2026 - v1.0 - Created project file, moved graphs out of Daisyworld.run
+          16/10/2026 - v1.1 - Number of every species in the run drawn
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import matplotlib.pyplot as plt
+
+# Lines the default species have always been drawn with, other species take the next colour matplotlib picks
+styles = {"black": 'b', "white": 'g', "red": 'r'}
+# Grey daisies are called red in the code
+labels = {"red": "Grey"}
+
+
+def plot_run(result, show_red=True):
+    """Shows the graphs Daisyworld.run used to show at the end of every run
+
+    :param results.RunResult result: Results of a run
+    :param bool show_red: Draws the number of grey daisies, called red in the code
+    """
+    columns = result.as_dict()
+    luminosity = columns["luminosity"]
+    plt.plot(luminosity, columns["avg_temp"], 'b')
+    plt.title('Temperature over luminosity')
+    plt.xlabel('Solar Luminosity')
+    plt.ylabel('Temperature (°C)')
+    plt.show()
+
+    plt.plot(luminosity, columns["avg_albedo"], 'b')
+    plt.title('Average albedo over luminosity')
+    plt.xlabel('Solar Luminosity')
+    plt.ylabel('Albedo')
+    plt.show()
+
+    for index, name in enumerate(result.names):
+        if name == "red" and not show_red:
+            continue
+        label = labels.get(name, name.capitalize()) + ' daisies'
+        plt.plot(luminosity, columns["counts"][:, index], styles.get(name, ''), label=label)
+    plt.legend(loc='upper right')
+    plt.title('Number of daisies over luminosity')
+    plt.xlabel('Solar Luminosity')
+    plt.ylabel('Count')
+    plt.show()
@@ -1,8 +1,26 @@
 import math
 import random
+import weakref
+from collections.abc import Mapping
+
+import numpy as np
+
+import backends
+import genome
+import kernels
+import neighbourhood
+import species as daisy_species
+from grid import NO_AGE
+from species import NO_SPECIES
+from streams import RandomStream
 
 
 class Point:
+    # Points are only views onto a grid, slots keep each one down to these five references and room for a weak
+    # reference. A view comes to under 200 bytes on top of the state the grid holds for it, a point made without a grid
+    # under 450 bytes with its row of the shared arrays and the weak reference that hands the row back included
+    __slots__ = ("x", "y", "grid", "cell", "bounds", "__weakref__")
+
     total_daisies = 0
     alive_daisies = 0
 
@@ -12,6 +30,7 @@ class Point:
     req_resource = 20
     sexual_cost = 15
     clonal_cost = 12
+    mate_range = 7  # Furthest distance a daisy will look for a mate
 
     mutation_rate_low = 0.01
     mutation_rate_high = 0.05
@@ -28,51 +47,130 @@ class Point:
     red = 0.5
     ground = 0.5
 
+    # Size of the planet a point made without a grid is on, points on a grid take the size of the grid
     x_dimension = 50
     y_dimension = 50
 
     flux = 1050  # Rate of energy received in Watts per metre**2.
     # Note: Value used is smaller than observed constant to simulate a younger star.
 
-    def __init__(self, x_coord, y_coord):
+    def __init__(self, x_coord, y_coord, grid=None):
         # Positional attributes of daisy or daisies
         self.x = x_coord
         self.y = y_coord
-        self.coordinates = [(x_coord, y_coord)]  # Location of daisy on a 50x50 grid
 
-        # Point attributes
-        self.colour = Point.ground
-        self.local_temp = None
-        self.age = None  # Daisy age
-        self.nutrients = None  # Number of accumulated nutrients
-        self.genes = None
-        self.opt_temp = None
+        # Point attributes live in the arrays of a grid, a point on its own takes a row of the arrays shared by every
+        # point made without a grid
+        if grid is None:
+            self.grid = _loose_cells()
+            self.cell = self.grid.take(self)
+            self.bounds = (Point.x_dimension, Point.y_dimension)  # Size of the planet the point is on
+        else:
+            self.grid = grid
+            self.cell = (x_coord, y_coord)
+            self.bounds = grid.shape
+
+    @property
+    def coordinates(self):
+        # Location of daisy on the grid, worked out when asked for rather than stored
+        return [(self.x, self.y)]
+
+    @property
+    def colour(self):
+        return float(self.grid.colour[self.cell])
+
+    @colour.setter
+    def colour(self, value):
+        self.grid.set_colour(self.cell, value)
+
+    @property
+    def local_temp(self):
+        return _none_if_nan(self.grid.local_temp[self.cell])
+
+    @local_temp.setter
+    def local_temp(self, value):
+        self.grid.local_temp[self.cell] = np.nan if value is None else value
+
+    @property
+    def age(self):
+        # Daisy age
+        age = int(self.grid.age[self.cell])
+        return None if age == NO_AGE else age
+
+    @age.setter
+    def age(self, value):
+        self.grid.age[self.cell] = NO_AGE if value is None else value
+
+    @property
+    def nutrients(self):
+        # Number of accumulated nutrients
+        return _none_if_nan(self.grid.nutrients[self.cell])
+
+    @nutrients.setter
+    def nutrients(self, value):
+        self.grid.nutrients[self.cell] = np.nan if value is None else value
+
+    @property
+    def genes(self):
+        # Gene values worked out from the allele codes on the grid, a copy so use set_gene to change one
+        genes = self.grid.genes[self.cell]
+        return None if genes[0] == genome.NO_GENE else genome.decode(genes)
+
+    @genes.setter
+    def genes(self, value):
+        self.grid.genes[self.cell] = genome.NO_GENE if value is None else genome.encode(value)
+
+    def set_gene(self, i, value):
+        self.grid.genes[self.cell + (i,)] = genome.encode(value)
+
+    @property
+    def species(self):
+        # Index of the daisy's species in the grid's species table, NO_SPECIES for none
+        return int(self.grid.species[self.cell])
+
+    @species.setter
+    def species(self, value):
+        self.grid.set_species(self.cell, value)
+
+    @property
+    def opt_temp(self):
+        return _none_if_nan(self.grid.opt_temp[self.cell])
+
+    @opt_temp.setter
+    def opt_temp(self, value):
+        self.grid.opt_temp[self.cell] = np.nan if value is None else value
 
     def grow_daisy(self, genes_list=None):
         Point.total_daisies += 1
         Point.alive_daisies += 1
         # Check if daisy exists, this is to reuse this method for new daisies
-        self.genes = genes_list
         if genes_list is None:
-            self.genes = [None] * Point.gene_length
+            genes_list = [None] * Point.gene_length
             for i in range(Point.gene_length):
-                self.genes[i] = random.randint(1, 10) / 10
+                genes_list[i] = self.grid.random.randint(1, 10) / 10
+        self.genes = genes_list
         self.expressed_colour()
         self.expressed_opt_temp()
 
     def expressed_colour(self):
         prob_list = []
-        total_val = self.genes[0] + self.genes[1] + self.genes[2]
-        # Up to three colours
-        for i in range(3):
-            prob_list.append(self.genes[i] / total_val)
-        res = self.pick_one(prob_list)
-        self.colour = list(Point.colours.values())[res]
+        genes = self.genes
+        table = self.grid.species_table
+        total_val = 0
+        for gene in table.genes:
+            total_val += genes[gene]
+        # One colour for each species
+        for gene in table.genes:
+            prob_list.append(genes[gene] / total_val)
+        res = self.pick_one(prob_list, self.grid.random)
+        self.species = int(table.picked(res))
+        self.colour = float(table.albedo[self.species])
 
     def expressed_opt_temp(self):
         # The expressed genes would be closest to local temperature
-        allele_A = self.local_temp * (self.colour + self.genes[3])
-        allele_B = self.local_temp * (self.colour + self.genes[4])
+        genes = self.genes
+        allele_A = self.local_temp * (self.colour + genes[3])
+        allele_B = self.local_temp * (self.colour + genes[4])
         delta_A = abs(self.local_temp - allele_A)
         delta_B = abs(self.local_temp - allele_B)
         if delta_B > delta_A:
@@ -81,26 +179,17 @@ class Point:
             self.opt_temp = allele_B
 
     @staticmethod
-    def pick_one(probabilities):
-        index = 0
-        r = random.randint(0, 10) / 10
-        while r > 0:
-            r = r - probabilities[index]
-            index += 1
-            if index >= len(probabilities):
-                break
-        index -= 1
-        return index
+    def pick_one(probabilities, rng=random):
+        return backends.roulette(probabilities, rng.randint(0, 10) / 10)
 
     def solar_factor(self):
         """Generates number between 0.8 - 1.2 based on y-coordinate between North and South pole and rounded to 2 d.p.
 
-        :param int y_coord: Specified y-coordinate on map
-
         :rtype: float
         :return: Multiplier
         """
-        return round(1.2 - 0.00064 * (self.y - 25) ** 2, 2)
+        # Taken from kernels.solar_factor so a point rounds the same way as the whole grid, on any height of planet
+        return float(kernels.solar_factor(self.y, self.bounds[1]))
 
     def check_pos(self):
         """Checks if daisy is present on a point
@@ -131,38 +220,19 @@ class Point:
         self.local_temp = q * (a_d - self.colour) + temp_d
 
     def find_neighbours(self):
-        # Six points going out from the chosen point
+        # Up to eight points touching the chosen point
         # Return all valid positions
-        delta = [(0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1)]
-        neighbours = []
-        # Unpack change x and y
-        for dx, dy in delta:
-            x = self.x + dx
-            y = self.y + dy
-            if self.is_valid_point(x, y):
-                neighbours.append((x, y))
-        return neighbours
+        return neighbourhood.table(neighbourhood.neighbour_deltas, *self.bounds).coords(self.x, self.y)
 
     def possible_points(self):
-        delta = [(0, 1), (0, 2), (0, 3), (0, 4), (0, 5), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (2, 0), (2, 1), (2, 2),
-                 (2, 3), (3, 0), (3, 1), (3, 2), (4, 0), (4, 1), (5, 0), (-1, 0), (-1, 1), (-1, 2), (-1, 3), (-1, 4),
-                 (-2, 0), (-2, 1), (-2, 2), (-2, 3), (-3, 0), (-3, 1), (-3, 2), (-4, 0), (-4, 1), (-5, 0), (0, -1),
-                 (1, -1), (2, -1), (3, -1), (4, -1), (0, -2), (1, -2), (2, -2), (3, -2), (0, -3), (1, -3), (2, -3),
-                 (0, -4), (1, -4), (0, -5), (-1, -1), (-2, -1), (-3, -1), (-4, -1), (-1, -2), (-2, -2), (-3, -2),
-                 (-1, -3), (-2, -3), (-1, -4)]
-        points = []
-        # Unpack change x and y
-        for dx, dy in delta:
-            x = self.x + dx
-            y = self.y + dy
-            if self.is_valid_point(x, y):
-                points.append((x, y))
-        return points
+        # Every valid point within 5 steps, where a child daisy can land
+        return neighbourhood.table(neighbourhood.dispersal_deltas, *self.bounds).coords(self.x, self.y)
 
     @staticmethod
-    def is_valid_point(x, y):
-        # Returns boolean value
-        return -1 < x < Point.x_dimension and -1 < y < Point.y_dimension
+    def is_valid_point(x, y, bounds=None):
+        # Returns boolean value, bounds is the size of the planet and defaults to the size of a point on its own
+        x_dim, y_dim = (Point.x_dimension, Point.y_dimension) if bounds is None else bounds
+        return -1 < x < x_dim and -1 < y < y_dim
 
     def beta_y(self, temp_y, c=0.003265):
         """Daisy growth rate function
@@ -197,10 +267,11 @@ class Point:
     def s_reproduce(self, partner):
         # Produces progeny
         genes = [None] * Point.gene_length
-        crossover = random.randint(0, Point.gene_length)
+        own_genes = self.genes
+        crossover = self.grid.random.randint(0, Point.gene_length)
         for i in range(Point.gene_length):
             if i > crossover:
-                genes[i] = self.genes[i]
+                genes[i] = own_genes[i]
             else:
                 genes[i] = partner[i]
         return genes
@@ -210,21 +281,21 @@ class Point:
         # large population size we have of daisies, variety does not need to be pushed for when handling with large
         # population as it's size makes up for it
         for i in range(Point.gene_length):
-            rand = random.randint(0, 10) / 10
+            rand = self.grid.random.randint(0, 10) / 10
             if rand < Point.mutation_rate_low:
-                self.genes[i] = random.randint(1, 10) / 10
+                self.set_gene(i, self.grid.random.randint(1, 10) / 10)
 
     def mutate_high(self):
         for i in range(Point.gene_length):
-            rand = random.randint(1, 10) / 10
+            rand = self.grid.random.randint(1, 10) / 10
             if rand < Point.mutation_rate_high:
-                self.genes[i] = random.randint(1, 10) / 10
+                self.set_gene(i, self.grid.random.randint(1, 10) / 10)
 
     def allocate_nutrients(self):
-        self.nutrients = random.randint(2, 5)
+        self.nutrients = self.grid.random.randint(2, 5)
 
     def randomise_age(self):
-        self.age = random.randint(0, 15)
+        self.age = self.grid.random.randint(0, 15)
 
     def __str__(self):
         return "Coordinates: " + str(self.coordinates) + ", Colour: " + str(self.colour) + \
@@ -232,5 +303,107 @@ class Point:
                ", Nutrients: " + str(self.nutrients) + ", Genes: " + str(self.genes) + \
                ", Optimum temperature: " + str(self.opt_temp)
 
-    def __del__(self):
-        return "Deleted daisy at coordinates: " + str(self.coordinates)
+
+class _Holder(weakref.ref):
+    # Weak reference to a point made without a grid that knows which row the point holds
+    __slots__ = ("row",)
+
+
+class _LooseCells:
+    """Stands in for a grid for points made without one, each point takes a row of arrays shared by all of them
+    rather than a grid of its own. Only has the parts of Grid a point uses"""
+
+    def __init__(self, gene_length, ground):
+        self.gene_length = gene_length
+        self.ground = ground
+        self.species_table = daisy_species.with_grey
+        self.random = RandomStream()
+        # Name, value and type of each array, laid out like the arrays of a grid one point wide
+        self.fills = (("colour", ground, float), ("local_temp", np.nan, float), ("age", NO_AGE, np.int16),
+                      ("nutrients", np.nan, float), ("opt_temp", np.nan, float), ("genes", genome.NO_GENE, np.uint8),
+                      ("species", NO_SPECIES, np.int8))
+        self.capacity = 0
+        self._free = []  # Rows not held by a point
+        self._holders = []  # Weak reference to the point holding each row, None for a free row
+        self._grow(64)
+
+    def _grow(self, capacity):
+        for name, fill, dtype in self.fills:
+            shape = (capacity, 1, self.gene_length) if name == "genes" else (capacity, 1)
+            array = np.full(shape, fill, dtype=dtype)
+            if self.capacity:
+                array[:self.capacity] = getattr(self, name)
+            setattr(self, name, array)
+        # Lowest rows handed out first
+        self._free.extend(range(capacity - 1, self.capacity - 1, -1))
+        self._holders.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def take(self, point):
+        """Hands a row over to a new point, cleared back to bare ground. The row is handed back once the point is
+        garbage, by a weak reference rather than a __del__ that would slow down the collector
+
+        :param Point point: Point taking the row
+
+        :rtype: tuple
+        :return: Cell of the point in the arrays
+        """
+        if not self._free:
+            self._grow(2 * self.capacity)
+        row = self._free.pop()
+        cell = (row, 0)
+        for name, fill, dtype in self.fills:
+            getattr(self, name)[cell] = fill
+        holder = _Holder(point, self._release)
+        holder.row = row
+        self._holders[row] = holder
+        return cell
+
+    def _release(self, holder):
+        # Called by a _Holder once its point is gone
+        self._holders[holder.row] = None
+        self._free.append(holder.row)
+
+    def set_colour(self, cell, value):
+        self.colour[cell] = value
+
+    def set_species(self, cell, value):
+        self.species[cell] = value
+
+
+_loose = None
+
+
+def _loose_cells():
+    # Made the first time a point is made without a grid, so worlds that never do so never make it
+    global _loose
+    if _loose is None:
+        _loose = _LooseCells(Point.gene_length, Point.ground)
+    return _loose
+
+
+class PointMap(Mapping):
+    """Read-only mapping of (x, y) to Point views, stands in for the old dictionary of Point objects"""
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def __getitem__(self, coords):
+        x, y = coords
+        if not (0 <= x < self.grid.x_dim and 0 <= y < self.grid.y_dim):
+            raise KeyError(coords)
+        return Point(x, y, self.grid)
+
+    def __iter__(self):
+        for x in range(self.grid.x_dim):
+            for y in range(self.grid.y_dim):
+                yield x, y
+
+    def __len__(self):
+        return self.grid.x_dim * self.grid.y_dim
+
+
+def _none_if_nan(value):
+    value = float(value)
+    return None if math.isnan(value) else value
+
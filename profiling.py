@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : profiling.py
+Date    : Friday 16 October 2026
+Desc.   : Opt-in timing of each phase of a cycle of the enhanced Daisyworld. A world is given a PhaseProfiler and
+          records how long every phase took, how many times it ran and how many daisies it worked through, for each
+          luminosity. Worlds without one get the shared NullProfiler, which does nothing, so leaving profiling off
+          costs next to nothing.
+History : 16/10/2026 - v1.0 - Created project file, added PhaseProfiler and NullProfiler
+          16/10/2026 - v1.1 - Added the placement phase of batched reproduction
+          16/10/2026 - v1.2 - Added the mate_index phase, building the index mate_search looks in
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import csv
+import json
+import time
+
+# Phases of a cycle in the order they happen
+phases = ("temperature", "growth", "collect", "shuffle", "mate_index", "mate_search", "clonal", "sexual",
+          "placement")
+# Columns of every exported row
+columns = ("step", "luminosity", "phase", "calls", "seconds", "population")
+
+
+class _NullPhase:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullProfiler:
+    enabled = False
+
+    def __init__(self):
+        self._phase = _NullPhase()
+
+    def start_cycle(self, step, lumen):
+        pass
+
+    def phase(self, name, population=0):
+        return self._phase
+
+
+class _Phase:
+    def __init__(self, profiler, name, population):
+        self.profiler = profiler
+        self.name = name
+        self.population = population
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.add(self.name, time.perf_counter() - self.start, self.population)
+        return False
+
+
+class PhaseProfiler:
+    enabled = True
+
+    def __init__(self):
+        # (step, luminosity) to phase name to [calls, seconds, population]
+        self.steps = {}
+        self._current = None
+
+    def start_cycle(self, step, lumen):
+        """Sets which luminosity the phases that follow are counted towards
+
+        :param int step: Position of the luminosity in the world's schedule
+        :param double lumen: Solar luminosity
+        """
+        self._current = self.steps.setdefault((step, float(lumen)), {})
+
+    def phase(self, name, population=0):
+        """Times the code inside a with block as one call of a phase
+
+        :param str name: One of phases
+        :param int population: Number of daisies the phase works through
+
+        :rtype: _Phase
+        :return: Context manager recording the phase when it exits
+        """
+        return _Phase(self, name, population)
+
+    def add(self, name, seconds, population=0, calls=1):
+        """Records time spent in a phase, for phases timed without a with block
+
+        :param str name: One of phases
+        :param double seconds: Wall time spent in the phase
+        :param int population: Number of daisies the phase worked through
+        :param int calls: Number of calls the time covers
+        """
+        if self._current is None:
+            self.start_cycle(0, float("nan"))
+        totals = self._current.setdefault(name, [0, 0.0, 0])
+        totals[0] += calls
+        totals[1] += seconds
+        totals[2] += population
+
+    def rows(self):
+        """Every phase of every luminosity, phases in the order they happen in a cycle
+
+        :rtype: list
+        :return: One dict per phase per luminosity, with the keys in columns
+        """
+        rows = []
+        for (step, lumen), totals in self.steps.items():
+            for name in sorted(totals, key=lambda name: phases.index(name) if name in phases else len(phases)):
+                calls, seconds, population = totals[name]
+                rows.append(dict(zip(columns, (step, lumen, name, calls, seconds, population))))
+        return rows
+
+    def totals(self):
+        """Time spent in each phase over the whole run
+
+        :rtype: dict
+        :return: Phase name to seconds
+        """
+        total = {}
+        for row in self.rows():
+            total[row["phase"]] = total.get(row["phase"], 0.0) + row["seconds"]
+        return total
+
+    def to_json(self, path):
+        """Writes every row to a JSON file
+
+        :param str path: File to write
+        """
+        with open(path, "w") as file:
+            json.dump(self.rows(), file, indent=2)
+
+    def to_csv(self, path):
+        """Writes every row to a CSV file with a header
+
+        :param str path: File to write
+        """
+        with open(path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(self.rows())
+
+    def clear(self):
+        self.steps = {}
+        self._current = None
+
+
+# Shared by every world that is not being profiled
+null_profiler = NullProfiler()
@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : result_cache.py
+Date    : Friday 16 October 2026
+Desc.   : Keeps the results of runs on disk so running the same configuration again, from a notebook or a batch job,
+          loads them instead of running the model. Each result is a .npz file named by a hash of every setting of
+          the run, its luminosity schedule, its seed and the source code of the model, so changing any of them runs
+          the model again. The files are kept under a size cap, the ones used least recently are deleted first.
+History : 16/10/2026 - v1.0 - Created project file, added ResultCache
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zipfile
+from collections import namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+# Modules whose source decides what a run gives, editing any of them changes the version of the code
+model_modules = ("backends", "daisyworld", "events", "genome", "grid", "kernels", "main", "neighbourhood", "placement",
+                 "point", "results", "simple_daisyworld", "spatial_index", "species", "stats", "streams")
+default_directory = os.path.join(os.path.expanduser("~"), ".cache", "daisyworld")
+default_max_bytes = 256 * 1024 ** 2
+
+# Hits and misses since the cache was opened, then what is on disk now
+CacheStats = namedtuple("CacheStats", ["hits", "misses", "stores", "evictions", "entries", "size"])
+
+
+@lru_cache(maxsize=None)
+def code_version(modules=model_modules):
+    """Hash of the source of the model, read once per process
+
+    :param tuple modules: Names of the modules, each one a .py file next to this one
+
+    :rtype: str
+    :return: Hex digest
+    """
+    digest = hashlib.sha256()
+    here = os.path.dirname(os.path.abspath(__file__))
+    for name in modules:
+        digest.update(name.encode())
+        with open(os.path.join(here, name + ".py"), "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+
+def _plain(value):
+    # json.dumps calls this for anything it cannot write itself, arrays and NumPy numbers become lists and numbers
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError("Cannot use " + type(value).__name__ + " in a cache key")
+
+
+def make_key(kind, params):
+    """Key of a run, the same settings always give the same key whatever order they were given in
+
+    :param str kind: What sort of run it is, so runs of different models never share a key
+    :param dict params: Every setting of the run, made of numbers, strings, lists, dicts and NumPy arrays
+
+    :rtype: str
+    :return: Hex digest
+    """
+    # Floats are written by repr, which gives back exactly the same float, so no setting is rounded
+    text = json.dumps({"kind": kind, "params": params, "code": code_version()}, sort_keys=True, default=_plain)
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, directory=None, max_bytes=default_max_bytes):
+        """
+        :param str directory: Folder the results are kept in, made if it is missing, None for ~/.cache/daisyworld
+        :param int max_bytes: Most space the results can take up before the least recently used are deleted
+        """
+        self.directory = default_directory if directory is None else directory
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".npz")
+
+    def get(self, key):
+        """Arrays stored under a key, marking them as just used
+
+        :param str key: Key from make_key
+
+        :rtype: dict
+        :return: Name to array, None if nothing is stored under the key
+        """
+        path = self._path(key)
+        try:
+            with np.load(path, allow_pickle=False) as stored:
+                arrays = {name: stored[name] for name in stored.files}
+            # The modified time orders the results by when they were last used
+            os.utime(path, ns=(time.time_ns(), time.time_ns()))
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, zipfile.BadZipFile):
+            # Left half written by a process that was killed, or evicted while being read
+            self._remove(path)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return arrays
+
+    def put(self, key, arrays):
+        """Stores arrays under a key, then deletes the least recently used results until under the size cap
+
+        :param str key: Key from make_key
+        :param dict arrays: Name to array
+        """
+        # Written to a temporary file then moved into place, so another process never reads half a result
+        handle, temporary = tempfile.mkstemp(suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(handle, "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            self._remove(temporary)
+            raise
+        self.stores += 1
+        self._evict()
+
+    def fetch(self, kind, params, compute):
+        """Stored result of a run, or runs it and stores what it gives
+
+        :param str kind: What sort of run it is
+        :param dict params: Every setting of the run
+        :param compute: Function with no arguments that runs it, returning a dict of arrays
+
+        :rtype: dict
+        :return: Name to array
+        """
+        key = make_key(kind, params)
+        arrays = self.get(key)
+        if arrays is None:
+            arrays = compute()
+            self.put(key, arrays)
+        return arrays
+
+    def _entries(self):
+        # Every stored result as (last used, size, path), oldest first
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npz"):
+                try:
+                    info = entry.stat()
+                except FileNotFoundError:  # Evicted by another process
+                    continue
+                entries.append((info.st_mtime_ns, info.st_size, entry.path))
+        return sorted(entries)
+
+    def _evict(self):
+        entries = self._entries()
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes:
+                break
+            self._remove(path)
+            size -= entry_size
+            self.evictions += 1
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self):
+        """How the cache has been used since it was opened, and how much is stored
+
+        :rtype: CacheStats
+        :return: Hits, misses, stores and evictions by this cache, then the number and total size of stored results
+        """
+        entries = self._entries()
+        return CacheStats(self.hits, self.misses, self.stores, self.evictions, len(entries),
+                          sum(entry[1] for entry in entries))
+
+    def clear(self):
+        """Deletes every stored result"""
+        for _, _, path in self._entries():
+            self._remove(path)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : results.py
+Date    : Friday 16 October 2026
+Desc.   : Results of a run of the enhanced Daisyworld held column by column in NumPy arrays that are allocated once
+          at the start of the run, one row per luminosity.
+History : 16/10/2026 - v1.0 - Created project file, added RunResult and StepResult
+          16/10/2026 - v1.1 - Added CycleSummary
+          16/10/2026 - v1.2 - Added RunResult.from_dict
+          16/10/2026 - v1.3 - One count for every species of the world's table, num_black, num_white and num_red kept
+                              as aliases
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+from collections import namedtuple
+
+import numpy as np
+
+# Species of the default table, the species a RunResult counts when it is not told which
+default_names = ("black", "white", "red")
+
+
+class CountAliases:
+    # num_black, num_white and num_red as results had them before any species table could be run, each one 0 for a
+    # world without that species. Classes using this define count_of
+    __slots__ = ()
+
+    @property
+    def num_black(self):
+        return self.count_of("black")
+
+    @property
+    def num_white(self):
+        return self.count_of("white")
+
+    @property
+    def num_red(self):
+        return self.count_of("red")
+
+
+class _SummaryCounts(CountAliases):
+    __slots__ = ()
+
+    def count_of(self, name):
+        """Number of daisies of one species
+
+        :param str name: Name of the species
+
+        :rtype: int
+        :return: Number of daisies, 0 if the world has no species of that name
+        """
+        return self.counts[self.names.index(name)] if name in self.names else 0
+
+
+class StepResult(_SummaryCounts, namedtuple("StepResult", ["luminosity", "avg_temp", "avg_albedo", "counts",
+                                                           "names"])):
+    # Row of a RunResult, what a world reports after each luminosity. counts holds the number of each species, in
+    # the order of names
+    __slots__ = ()
+
+
+class CycleSummary(_SummaryCounts, namedtuple("CycleSummary", ["luminosity", "cycle", "avg_temp", "avg_albedo",
+                                                               "counts", "names", "population"])):
+    # What a world reports after each cycle, cycle counts every cycle since the world was made
+    __slots__ = ()
+
+
+class RunResult(CountAliases):
+    columns = ("luminosity", "avg_temp", "avg_albedo", "counts")
+
+    def __init__(self, luminosities, names=default_names):
+        """
+        :param luminosities: Luminosity schedule of the run
+        :param tuple names: Name of each species counted, in the order of the world's species table
+        """
+        steps = len(luminosities)
+        self.names = tuple(names)
+        self.luminosity = np.array(luminosities, dtype=float)
+        self.avg_temp = np.full(steps, np.nan)  # Average temperature over the cycles at each luminosity
+        self.avg_albedo = np.full(steps, np.nan)  # Average albedo over the cycles at each luminosity
+        # Number of each species at the end of each luminosity, one column per species
+        self.counts = np.zeros((steps, len(self.names)), dtype=np.int64)
+        self.filled = 0  # Number of luminosities recorded so far
+
+    def __len__(self):
+        return self.filled
+
+    def record(self, step):
+        """Writes the results of the next luminosity
+
+        :param StepResult step: Results of one luminosity
+        """
+        for name in self.columns:
+            getattr(self, name)[self.filled] = getattr(step, name)
+        self.filled += 1
+
+    def row(self, index):
+        """Results of one luminosity
+
+        :param int index: Position of the luminosity in the run
+
+        :rtype: StepResult
+        :return: Results of that luminosity
+        """
+        return StepResult(self.luminosity[index].item(), self.avg_temp[index].item(), self.avg_albedo[index].item(),
+                          tuple(self.counts[index].tolist()), self.names)
+
+    def count_of(self, name):
+        """Number of daisies of one species at each luminosity
+
+        :param str name: Name of the species
+
+        :rtype: numpy.ndarray
+        :return: Count at each luminosity, all 0 if the world has no species of that name
+        """
+        if name not in self.names:
+            return np.zeros(len(self.luminosity), dtype=np.int64)
+        return self.counts[:, self.names.index(name)]
+
+    def as_dict(self):
+        """Every column cut down to the luminosities recorded so far, along with the names of the species counted
+
+        :rtype: dict
+        :return: Column name to array
+        """
+        columns = {name: getattr(self, name)[:self.filled] for name in self.columns}
+        columns["names"] = np.array(self.names)
+        return columns
+
+    @classmethod
+    def from_dict(cls, columns):
+        """Results made again from what as_dict returned
+
+        :param dict columns: Column name to array, every column the same length
+
+        :rtype: RunResult
+        :return: Results with every row recorded
+        """
+        result = cls(columns["luminosity"], [str(name) for name in columns["names"]])
+        for name in cls.columns:
+            getattr(result, name)[:] = columns[name]
+        result.filled = len(result.luminosity)
+        return result
@@ -8,6 +8,8 @@ Desc.   : Modelling the Gaia hypothesis by implementing a the version James Love
           the foundations to further develop Daisyworld.
 History : 25/12/2020 - v1.0 - Created project file
           30/12/2020 - v1.1 - Added methods derived from equations from Watson's and Lovelock's published paper.
+          16/10/2026 - v1.2 - Growth rate constants and death rate moved here so they can be shared
+          16/10/2026 - v1.3 - Added adaptive step integrator that stops once the daisies reach equilibrium
 
 """
 
@@ -18,6 +20,13 @@ __status__ = "Prototype"  # "Development" "Prototype" "Production"
 
 import math
 
+# Value of c in beta_y for each growth rate setting
+growth_rates = {
+    "high": 0.002,
+    "low": 0.013265,
+    "default": 0.003265
+}
+
 
 def uncolonised_ground(area_b, area_w):
     """Calculates fractional area of uncolonised ground
@@ -50,6 +59,22 @@ def beta_y(temp_y, opt_temp=22.5, c=0.003265):
         return 0
 
 
+def death_rate(time_step, death_type="default"):
+    """Death rate of both daisies at a point in time
+
+    :param int time_step: Arbitrary measure of time
+    :param str death_type: "default" for a constant death rate, "plague" for one that rises and falls over time
+
+    :rtype: double
+    :return: Death rate of black and white daisies
+    """
+    if death_type == "plague":
+        return -0.15 * math.cos(time_step) + 0.45
+    elif death_type == "default":
+        return 0.3
+    raise ValueError("Unknown death type: " + str(death_type))
+
+
 def daisy_growth(area_y, area_g, beta, gamma):
     """Calculates rate of change either in black or white daisies
 
@@ -119,3 +144,84 @@ def solar_luminosity(time_step, sim_length):
     :return: A multiplier from range 0.6 - 1.2
     """
     return 0.6 + (time_step * (1/sim_length))
+
+
+def derivatives(area_b, area_w, lumen, gamma, a_b=0.25, a_w=0.75, a_g=0.5, flux=1050, c=0.003265):
+    """Rate of change of both daisies, the same equations main.simple_main steps through
+
+    :param double area_b: Fraction of surface area for black daisies
+    :param double area_w: Fraction of surface area for white daisies
+    :param double lumen: Solar luminosity
+    :param double gamma: Death rate of black and white daisies
+    :param double a_b: Albedo of black daisy
+    :param double a_w: Albedo of white daisy
+    :param double a_g: Albedo of bare ground
+    :param double flux: Solar flux constant
+    :param double c: Determines quadratic width of beta_y
+
+    :rtype: tuple
+    :return: Rate of change of black daisies, of white daisies and the average temperature of Daisyworld
+    """
+    x = uncolonised_ground(area_b, area_w)
+    a_d = planetary_albedo(area_b, area_w, x, a_b=a_b, a_w=a_w, a_g=a_g)
+    temp_d = planetary_temp(flux, lumen, a_d)
+    beta_b = beta_y(local_temp(a_b, a_d, temp_d), c=c)
+    beta_w = beta_y(local_temp(a_w, a_d, temp_d), c=c)
+    return daisy_growth(area_b, x, beta_b, gamma), daisy_growth(area_w, x, beta_w, gamma), temp_d
+
+
+def integrate_adaptive(area_b, area_w, lumen, gamma, a_b=0.25, a_w=0.75, a_g=0.5, flux=1050, c=0.003265,
+                       horizon=10000, tol=1e-10, max_steps=1000):
+    """Integrates both daisies with implicit Euler steps that get longer as the daisies settle, known as pseudo
+    transient continuation. Each step grows by how much the rate of change fell over the last one, so once close to
+    equilibrium the steps become Newton's method and it stops as soon as neither daisy changes faster than tol
+
+    :param double area_b: Starting fraction of surface area for black daisies
+    :param double area_w: Starting fraction of surface area for white daisies
+    :param double lumen: Solar luminosity
+    :param double gamma: Death rate of black and white daisies
+    :param double a_b: Albedo of black daisy
+    :param double a_w: Albedo of white daisy
+    :param double a_g: Albedo of bare ground
+    :param double flux: Solar flux constant
+    :param double c: Determines quadratic width of beta_y
+    :param double horizon: Longest time to integrate for, main.simple_main uses one unit per step
+    :param double tol: Rate of change below which the daisies are at equilibrium
+    :param int max_steps: Most steps to take
+
+    :rtype: tuple
+    :return: Fraction of black daisies, of white daisies, average temperature and number of steps taken
+    """
+    def f(b, w):
+        return derivatives(b, w, lumen, gamma, a_b=a_b, a_w=a_w, a_g=a_g, flux=flux, c=c)
+
+    t = 0
+    h = 1
+    steps = 0
+    db, dw, temp_d = f(area_b, area_w)
+    rate = max(abs(db), abs(dw))
+    while t < horizon and rate >= tol and steps < max_steps:
+        # Jacobian by finite differences
+        e = 1e-8
+        db_b, dw_b, _ = f(area_b + e, area_w)
+        db_w, dw_w, _ = f(area_b, area_w + e)
+        j11, j12 = (db_b - db) / e, (db_w - db) / e
+        j21, j22 = (dw_b - dw) / e, (dw_w - dw) / e
+        # Solve (I - h*J) * change = h * rate of change by Cramer's rule
+        m11, m12, m21, m22 = 1 - h * j11, -h * j12, -h * j21, 1 - h * j22
+        det = m11 * m22 - m12 * m21
+        if det != 0:
+            new_b = area_b + h * (db * m22 - m12 * dw) / det
+            new_w = area_w + h * (m11 * dw - db * m21) / det
+        if det == 0 or not (new_b >= 0 and new_w >= 0 and new_b + new_w <= 1):
+            # Step went past what the daisies can cover, try a shorter one
+            h /= 4
+            continue
+        new_db, new_dw, new_temp_d = f(new_b, new_w)
+        new_rate = max(abs(new_db), abs(new_dw))
+        t += h
+        steps += 1
+        h *= min(10, max(0.5, rate / new_rate)) if new_rate else 10
+        area_b, area_w, temp_d = new_b, new_w, new_temp_d
+        db, dw, rate = new_db, new_dw, new_rate
+    return area_b, area_w, temp_d, steps
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : simple_sweep.py
+Date    : Friday 16 October 2026
+Desc.   : Runs the classic Daisyworld from simple_daisyworld.py for many settings at once. Each setting of albedos,
+          death type and growth rate is one element of a NumPy array, so a whole grid of settings is integrated
+          with the same number of steps as a single run of main.simple_main.
+History : 16/10/2026 - v1.0 - Created project file, added vectorised beta_y and sweep
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import numpy as np
+
+import simple_daisyworld as simple
+
+
+class SweepResult:
+    def __init__(self, luminosity, planet_temp, planet_temp_d, b_coverage, w_coverage):
+        self.luminosity = luminosity  # Solar luminosity at each step, shape (steps,)
+        self.planet_temp = planet_temp  # Temperature without daisies, shape (steps,)
+        self.planet_temp_d = planet_temp_d  # Temperature with daisies, shape (settings, steps)
+        self.b_coverage = b_coverage  # Area covered by black daisies in %, shape (settings, steps)
+        self.w_coverage = w_coverage  # Area covered by white daisies in %, shape (settings, steps)
+
+    def __len__(self):
+        return len(self.planet_temp_d)
+
+
+def beta_y(temp_y, opt_temp=22.5, c=0.003265):
+    """Daisy growth rate function for arrays, same curve as simple_daisyworld.beta_y
+
+    :param numpy.ndarray temp_y: Local temperature experienced by the daisies
+    :param double opt_temp: Optimum temperature for black and white daisies to thrive at
+    :param numpy.ndarray c: Determines quadratic width, one value per setting or one for all
+
+    :rtype: numpy.ndarray
+    :return: Values between 0 - 1, 0 indicating no growth, 1 indicating maximal growth
+    """
+    return _beta(temp_y, opt_temp, c, growth_window(opt_temp, c))
+
+
+def growth_window(opt_temp=22.5, c=0.003265):
+    """Temperatures daisies can grow between, only depends on the settings so is worked out once per sweep
+
+    :param double opt_temp: Optimum temperature for black and white daisies to thrive at
+    :param numpy.ndarray c: Determines quadratic width
+
+    :rtype: tuple
+    :return: Lowest and highest temperature with growth
+    """
+    width = np.sqrt(1 / np.asarray(c, dtype=float))
+    return np.round(opt_temp - width, 1), np.round(opt_temp + width, 1)
+
+
+def _beta(temp_y, opt_temp, c, window):
+    min_growth, max_growth = window
+    in_range = (min_growth <= temp_y) & (temp_y <= max_growth)
+    return np.where(in_range, 1 - c * (opt_temp - temp_y) ** 2, 0.0)
+
+
+def settings(albedo_b, albedo_w, death_type="default", growth_rate="default"):
+    """Broadcasts settings against each other into flat arrays, one element per run
+
+    :param albedo_b: Albedo of black daisies, a number or a sequence
+    :param albedo_w: Albedo of white daisies, a number or a sequence
+    :param death_type: "default" or "plague", or a sequence of them
+    :param growth_rate: "default", "high" or "low", or a sequence of them
+
+    :rtype: tuple
+    :return: Arrays of black albedo, white albedo, whether plague is on and c for beta_y
+    """
+    for name in np.unique(death_type):
+        # Raises for anything that is not a known death type
+        simple.death_rate(0, name)
+    plague = np.asarray(death_type) == "plague"
+    c = np.vectorize(simple.growth_rates.__getitem__, otypes=[float])(growth_rate)
+    a_b, a_w, plague, c = np.broadcast_arrays(np.asarray(albedo_b, dtype=float), np.asarray(albedo_w, dtype=float),
+                                              plague, c)
+    return a_b.ravel(), a_w.ravel(), plague.ravel(), c.ravel()
+
+
+def sweep(albedo_b, albedo_w, death_type="default", growth_rate="default", sim_length=550, resolution=10000,
+          flux=1050, a_g=0.5, opt_temp=22.5):
+    """Integrates every setting over the rise in luminosity at the same time, each run follows the same steps as
+    main.simple_main
+
+    :param albedo_b: Albedo of black daisies, a number or a sequence
+    :param albedo_w: Albedo of white daisies, a number or a sequence
+    :param death_type: "default" or "plague", or a sequence of them
+    :param growth_rate: "default", "high" or "low", or a sequence of them
+    :param int sim_length: Number of luminosity steps
+    :param int resolution: Number of Euler steps at each luminosity
+    :param double flux: Rate of energy received in Watts per metre**2
+    :param double a_g: Albedo of bare ground
+    :param double opt_temp: Optimum temperature for black and white daisies to thrive at
+
+    :rtype: SweepResult
+    :return: Temperature and coverage of every setting at every luminosity, settings in broadcast order
+    """
+    a_b, a_w, plague, c = settings(albedo_b, albedo_w, death_type, growth_rate)
+    num_settings = len(a_b)
+    area_b = np.full(num_settings, 0.01)
+    area_w = np.full(num_settings, 0.01)
+    temp_d = np.full(num_settings, np.nan)
+    window = growth_window(opt_temp, c)
+
+    luminosity = np.empty(sim_length)
+    planet_temp = np.empty(sim_length)
+    planet_temp_d = np.empty((num_settings, sim_length))
+    b_coverage = np.empty((num_settings, sim_length))
+    w_coverage = np.empty((num_settings, sim_length))
+
+    for step in range(sim_length):
+        # Make sure black/white daisy does not go under 0.01 threshold
+        np.maximum(area_b, 0.01, out=area_b)
+        np.maximum(area_w, 0.01, out=area_w)
+        gamma = np.where(plague, simple.death_rate(step, "plague"), simple.death_rate(step))
+        lumen = simple.solar_luminosity(step, sim_length)
+        for i in range(resolution):
+            x = simple.uncolonised_ground(area_b, area_w)
+            a_d = simple.planetary_albedo(area_b, area_w, x, a_b=a_b, a_w=a_w, a_g=a_g)
+            temp_d = simple.planetary_temp(flux, lumen, a_d)
+
+            beta_b = _beta(simple.local_temp(a_b, a_d, temp_d), opt_temp, c, window)
+            beta_w = _beta(simple.local_temp(a_w, a_d, temp_d), opt_temp, c, window)
+
+            darea_bdt = simple.daisy_growth(area_b, x, beta_b, gamma)
+            darea_wdt = simple.daisy_growth(area_w, x, beta_w, gamma)
+            area_b += darea_bdt
+            area_w += darea_wdt
+        luminosity[step] = lumen
+        planet_temp[step] = simple.planetary_temp(flux, lumen, a_g)
+        planet_temp_d[:, step] = temp_d
+        b_coverage[:, step] = area_b * 100
+        w_coverage[:, step] = area_w * 100
+
+    return SweepResult(luminosity, planet_temp, planet_temp_d, b_coverage, w_coverage)
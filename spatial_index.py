@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : spatial_index.py
+Date    : Friday 16 October 2026
+Desc.   : Uniform grid of buckets over the coordinates of mature daisies, used to find the best mate for a daisy
+          without comparing it against every other mature daisy on the planet.
+History : 16/10/2026 - v1.0 - Created project file, added MateIndex
+          16/10/2026 - v1.1 - Added SortedMateIndex for compiled mate searches
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import math
+
+import numpy as np
+
+
+class MateIndex:
+    def __init__(self, coords, radius):
+        """Buckets are as wide as the search radius, so any mate in range is in the same or a neighbouring bucket
+
+        :param list coords: Coordinates of the mature daisies, in the order they get to pick a mate
+        :param int radius: Furthest distance a daisy will go to find a mate
+        """
+        self.radius = radius
+        self.width = max(1, math.ceil(radius))
+        self.rank = dict()  # Position of each daisy in coords, earlier daisies win ties
+        self.buckets = dict()
+        for rank, coord in enumerate(coords):
+            self.rank[coord] = rank
+            self.buckets.setdefault(self.bucket(coord), set()).add(coord)
+
+    def bucket(self, coord):
+        return coord[0] // self.width, coord[1] // self.width
+
+    def __contains__(self, coord):
+        return coord in self.rank
+
+    def __len__(self):
+        return len(self.rank)
+
+    def remove(self, coord):
+        """Takes a daisy out of the index once it has reproduced
+
+        :param tuple coord: Coordinates of daisy
+        """
+        del self.rank[coord]
+        self.buckets[self.bucket(coord)].discard(coord)
+
+    def best_mate(self, coord, nutrients):
+        """Finds the mate with the highest fitness, nutrients / distance, within the radius of a daisy
+
+        :param tuple coord: Coordinates of the daisy looking for a mate
+        :param numpy.ndarray nutrients: Nutrients of every point on the grid
+
+        :rtype: tuple
+        :return: Coordinates of the best mate, None if there are no mates in range
+        """
+        x1, y1 = coord
+        bx, by = self.bucket(coord)
+        best_mate = None
+        best_fitness = 0
+        best_rank = None
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for mate in self.buckets.get((bx + dx, by + dy), ()):
+                    x2, y2 = mate
+                    # Works out Euclidean distance between daisies
+                    locality = math.sqrt((x1 - x2) ** 2 + (y1 - y2) ** 2)
+                    if locality == 0 or locality > self.radius:
+                        continue
+                    fitness = nutrients[mate] / locality
+                    rank = self.rank[mate]
+                    if fitness > best_fitness or (fitness == best_fitness and best_rank is not None and rank < best_rank):
+                        best_mate = mate
+                        best_fitness = fitness
+                        best_rank = rank
+        return best_mate
+
+
+class SortedMateIndex:
+    def __init__(self, coords, radius, shape, search):
+        """Same as MateIndex with the daisies held in arrays sorted by flat index, so a compiled search can walk the
+        rows of the square around a daisy as slices
+
+        :param list coords: Coordinates of the mature daisies, in the order they get to pick a mate
+        :param int radius: Furthest distance a daisy will go to find a mate
+        :param tuple shape: Dimensions of the grid
+        :param search: Function finding the best mate, see backends._best_mate
+        """
+        self.radius = radius
+        self.y_dim = shape[1]
+        cells = np.array([x * self.y_dim + y for x, y in coords], dtype=np.intp)
+        order = np.argsort(cells, kind="stable")
+        self.cells = cells[order]
+        self.rank = order  # Position of each daisy in coords, earlier daisies win ties
+        self.alive = np.ones(len(cells), dtype=bool)
+        # Where each daisy still in the index sits in cells
+        self.position = {coords[rank]: i for i, rank in enumerate(order.tolist())}
+        self.search = search
+
+    def __contains__(self, coord):
+        return coord in self.position
+
+    def __len__(self):
+        return len(self.position)
+
+    def remove(self, coord):
+        """Takes a daisy out of the index once it has reproduced
+
+        :param tuple coord: Coordinates of daisy
+        """
+        self.alive[self.position.pop(coord)] = False
+
+    def best_mate(self, coord, nutrients):
+        """Finds the mate with the highest fitness, nutrients / distance, within the radius of a daisy
+
+        :param tuple coord: Coordinates of the daisy looking for a mate
+        :param numpy.ndarray nutrients: Nutrients of every point on the grid
+
+        :rtype: tuple
+        :return: Coordinates of the best mate, None if there are no mates in range
+        """
+        mate = self.search(self.cells, self.rank, self.alive, nutrients, coord[0], coord[1], float(self.radius))
+        return None if mate < 0 else divmod(int(mate), self.y_dim)
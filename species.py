@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : species.py
+Date    : Friday 16 October 2026
+Desc.   : Tables of the kinds of daisy living on the enhanced Daisyworld. Each species has an albedo, the gene that
+          weights the chance of a daisy expressing it and the range of children it has. Daisies store the index of
+          their species so they are counted with bincount rather than by comparing albedos. with_grey is the model
+          daisyworld.py always ran, without_grey the one that used to live in dw_without_grey.py.
+History : 16/10/2026 - v1.0 - Created project file, added Species, SpeciesTable, with_grey and without_grey
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+from collections import namedtuple
+
+import numpy as np
+
+NO_SPECIES = -1  # Stored where there is no daisy
+
+# offspring is the lowest and highest number of clones or children, inclusive, a daisy of the species has per turn
+Species = namedtuple("Species", ["name", "albedo", "gene", "offspring"])
+
+
+class SpeciesTable:
+    def __init__(self, species, ground=0.5, unpicked=None):
+        """
+        :param species: Every Species, a daisy picks between them in this order
+        :param double ground: Albedo of bare ground
+        :param int unpicked: Index of the species a daisy gets when Point.pick_one draws 0 and picks no species, None
+                             for it to take the albedo of bare ground without being counted
+        """
+        self.species = tuple(species)
+        self.ground = ground
+        self.unpicked = unpicked
+        self.names = tuple(kind.name for kind in self.species)
+        self.genes = np.array([kind.gene for kind in self.species], dtype=np.intp)
+        self.offspring = tuple(tuple(int(n) for n in kind.offspring) for kind in self.species)
+        # Albedo of each species with bare ground on the end, so indexing with NO_SPECIES gives ground
+        self.albedo = np.array([kind.albedo for kind in self.species] + [ground])
+
+    def __len__(self):
+        return len(self.species)
+
+    def __getitem__(self, index):
+        return self.species[index]
+
+    def index(self, name):
+        """Position of a species in the table
+
+        :param str name: Name of the species
+
+        :rtype: int
+        :return: Index of the species, None if there is no species of that name
+        """
+        return self.names.index(name) if name in self.names else None
+
+    def picked(self, index):
+        """Species a daisy ends up as from what Point.pick_one returned
+
+        :param index: Index returned by pick_one, -1 when it picked nothing
+
+        :return: Index of the species, NO_SPECIES for bare ground
+        """
+        unpicked = NO_SPECIES if self.unpicked is None else self.unpicked
+        return np.where(np.asarray(index) < 0, unpicked, index)
+
+
+# Grey daisies, called red in the code, have the same albedo as bare ground so are never counted as growing. When no
+# colour is picked the daisy took the last of Point.colours, ground, which was counted as grey
+with_grey = SpeciesTable([Species("black", 0.25, 0, (0, 2)),
+                          Species("white", 0.75, 1, (0, 2)),
+                          Species("red", 0.5, 2, (0, 2))], unpicked=2)
+without_grey = SpeciesTable([Species("black", 0.25, 0, (3, 7)),
+                             Species("white", 0.75, 1, (3, 7))])
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+
+Module  : CMP-6013Y - CMP Third Year Project
+File    : stats.py
+Date    : Friday 16 October 2026
+Desc.   : Running totals of what is on the grid, kept up to date by the grid every time a daisy is born or dies so
+          reading them never needs a pass over the whole grid. Totals are kept for each row, a line of latitude, so
+          the count of each species, the albedo and the temperature of any band of latitudes come from summing a
+          few rows. The diffused temperature of the whole planet comes from the same rows, as averaging each point
+          with its neighbours splits into a weight along x times a weight along y.
+History : 16/10/2026 - v1.0 - Created project file, added StatsTracker
+
+"""
+
+__author__ = "Steven Diep"
+__maintainer__ = "Steven Diep"
+__email__ = "steven_diep@hotmail.co.uk"
+__status__ = "Prototype"  # "Development" "Prototype" "Production"
+
+import numpy as np
+
+import kernels
+
+
+class StatsTracker:
+    def __init__(self, grid, flux=1050, q=20):
+        """Counts everything on a grid, then keeps counting as the grid changes
+
+        :param grid.Grid grid: Grid to track
+        :param double flux: Solar flux constant, Point.flux
+        :param int q: Heat absorption coefficient, as used by kernels.local_temp
+        """
+        self.grid = grid
+        self.flux = flux
+        self.q = q
+        # One column for each species and one on the end counting points without a species
+        self.columns = len(grid.species_table) + 1
+        self.x_weights = kernels.diffusion_weights(grid.x_dim)
+        self.y_weights = kernels.diffusion_weights(grid.y_dim)
+        self.solar = kernels.solar_factor(np.arange(grid.y_dim), grid.y_dim)
+        self.rebuild()
+        grid.stats = self
+        # Sums over the cycles of the luminosity being gone through
+        self.cycles = 0
+        self.temp_total = 0.0
+        self.albedo_total = 0.0
+
+    def rebuild(self):
+        """Counts everything again from the arrays of the grid, needed after writing to them directly"""
+        grid = self.grid
+        species = grid.species % self.columns
+        self.row_counts = np.stack([np.count_nonzero(species == kind, axis=0) for kind in range(self.columns)],
+                                   axis=1).astype(np.int64)  # Points of each species in each row
+        above_ground = grid.colour - grid.ground
+        self.row_colour = above_ground.sum(axis=0)  # Albedo above that of bare ground in each row
+        self.row_weighted = self.x_weights @ above_ground  # Same, each point weighted as it is when diffusing
+
+    def changed(self, cells, old_species, new_species, old_colour, new_colour):
+        """Counts a change to many points at once, called by the grid
+
+        :param numpy.ndarray cells: Flat indices of the points
+        :param old_species: Species of each point before the change
+        :param new_species: Species of each point after the change
+        :param old_colour: Albedo of each point before the change
+        :param new_colour: Albedo of each point after the change
+        """
+        y_dim = self.grid.y_dim
+        x, y = np.divmod(cells, y_dim)
+        size = y_dim * self.columns
+        old_species = np.broadcast_to(old_species, cells.shape) % self.columns
+        new_species = np.broadcast_to(new_species, cells.shape) % self.columns
+        self.row_counts += (np.bincount(y * self.columns + new_species, minlength=size) -
+                            np.bincount(y * self.columns + old_species, minlength=size)).reshape(y_dim, -1)
+        change = np.broadcast_to(np.subtract(new_colour, old_colour), cells.shape)
+        self.row_colour += np.bincount(y, change, minlength=y_dim)
+        self.row_weighted += np.bincount(y, change * self.x_weights[x], minlength=y_dim)
+
+    def colour_changed(self, cell, old, new):
+        """Counts a change to the albedo of one point, called by the grid
+
+        :param tuple cell: Coordinates of the point
+        :param double old: Albedo before
+        :param double new: Albedo after
+        """
+        x, y = cell
+        self.row_colour[y] += new - old
+        self.row_weighted[y] += (new - old) * self.x_weights[x]
+
+    def species_changed(self, cell, old, new):
+        """Counts a change to the species of one point, called by the grid
+
+        :param tuple cell: Coordinates of the point
+        :param int old: Species before
+        :param int new: Species after
+        """
+        y = cell[1]
+        self.row_counts[y, old % self.columns] -= 1
+        self.row_counts[y, new % self.columns] += 1
+
+    def counts(self, y0=0, y1=None):
+        """Number of daisies of each species on the grid, red daisies included even though they have the albedo of
+        bare ground. Unlike Daisyworld.counts, which counts every daisy that has grown, these are only the living
+
+        :param int y0: First row of the band to count
+        :param int y1: Row after the last of the band, None for the top of the grid
+
+        :rtype: numpy.ndarray
+        :return: Count of each species, in the order of the species table
+        """
+        return self.row_counts[y0:y1, :-1].sum(axis=0)
+
+    def albedo(self, y0=0, y1=None):
+        """Average albedo of the surface, daisies and bare ground
+
+        :param int y0: First row of the band to average over
+        :param int y1: Row after the last of the band, None for the top of the grid
+
+        :rtype: float
+        :return: Average albedo
+        """
+        rows = self.row_colour[y0:y1]
+        return self.grid.ground + float(rows.sum()) / (self.grid.x_dim * len(rows))
+
+    def row_temps(self, a_d, lumen):
+        """Average temperature of each row before diffusing, what Daisyworld.calc_temps puts in local_temp
+
+        :param double a_d: Planetary albedo
+        :param double lumen: Solar luminosity
+
+        :rtype: numpy.ndarray
+        :return: Temperature of each row
+        """
+        colour = self.grid.ground + self.row_colour / self.grid.x_dim
+        return kernels.local_temp(colour, self.solar, a_d, lumen, self.flux, self.q)
+
+    def avg_temp(self, a_d, lumen):
+        """Average temperature of the planet after diffusing, the mean of what Daisyworld.calc_temps returns
+
+        :param double a_d: Planetary albedo
+        :param double lumen: Solar luminosity
+
+        :rtype: float
+        :return: Average temperature
+        """
+        grid = self.grid
+        # The weights along x add up to x_dim, so the part of the temperature shared by a whole row only needs its
+        # weight along y
+        shared = self.q * (a_d - grid.ground) + kernels.radiative_temp(self.solar, a_d, lumen, self.flux)
+        total = self.y_weights @ (grid.x_dim * shared - self.q * self.row_weighted)
+        return float(total) / (grid.x_dim * grid.y_dim)
+
+    def start_luminosity(self):
+        """Empties the sums, called before the cycles of a new luminosity"""
+        self.cycles = 0
+        self.temp_total = 0.0
+        self.albedo_total = 0.0
+
+    def add_cycle(self, avg_temp, avg_albedo):
+        """Adds a cycle to the sums of the luminosity being gone through
+
+        :param double avg_temp: Average temperature of the cycle
+        :param double avg_albedo: Average albedo of the cycle
+        """
+        self.cycles += 1
+        self.temp_total += avg_temp
+        self.albedo_total += avg_albedo
+
+    def luminosity_means(self):
+        """Averages over the cycles added since start_luminosity
+
+        :rtype: tuple
+        :return: Average temperature and average albedo
+        """
+        return self.temp_total / self.cycles, self.albedo_total / self.cycles